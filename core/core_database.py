@@ -8,12 +8,26 @@ Centralized Database Manager for ED Mining Suite
 """
 
 import os
+import re
+import copy
 import json
+import time
+import queue
+import array
 import sqlite3
 import logging
+import functools
+import itertools
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Iterator, NamedTuple, Union
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +38,24 @@ DATA_DIR = Path("data")
 DB_PATH = DATA_DIR / "ed_mining_data.db"
 CONFIG_PATH = DATA_DIR / "ed_mining_config.json"
 LOG_READER_LOG = DATA_DIR / "ed_log_reader.log"
+LOG_READER_PID = DATA_DIR / "ed_log_reader.pid"
+
+# Stored in PRAGMA user_version; bump together with each new _MIGRATIONS entry
+SCHEMA_VERSION = 5
+
+# Batched writes are committed early once either limit is reached
+BATCH_AUTOFLUSH_ROWS = 500
+BATCH_AUTOFLUSH_SECONDS = 0.25
+
+# The background writer commits once either limit is reached
+WRITER_BATCH_ROWS = 500
+WRITER_BATCH_SECONDS = 0.1
+# Producers block once this many writes are queued instead of growing without bound
+WRITER_QUEUE_SIZE = 10000
+# A busy/locked batch is kept and retried with doubling delays for up to this long
+WRITER_RETRY_DELAY = 0.05
+WRITER_RETRY_MAX_DELAY = 2.0
+WRITER_RETRY_SECONDS = 30.0
 
 # Default config structure
 DEFAULT_CONFIG = {
@@ -60,22 +92,41 @@ DEFAULT_CONFIG = {
 # ============================================================================
 # CONFIG FILE MANAGEMENT
 # ============================================================================
+_dir_ready = False
+
+def _ensure_data_dir() -> None:
+    """Create DATA_DIR on first use only (skips the stat/mkdir afterwards)."""
+    global _dir_ready
+    if not _dir_ready:
+        DATA_DIR.mkdir(exist_ok=True)
+        _dir_ready = True
+
+# Parsed config, reused until the file's mtime changes
+_CONFIG_CACHE: Dict[str, Any] = {"mtime": None, "data": None}
+
 def load_config() -> Dict[str, Any]:
     """Load config from JSON, create with defaults if missing."""
-    DATA_DIR.mkdir(exist_ok=True)
-    if not CONFIG_PATH.exists():
+    _ensure_data_dir()
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         save_config(DEFAULT_CONFIG)
         logger.info(f"Created default config at {CONFIG_PATH}")
         return DEFAULT_CONFIG.copy()
 
+    if mtime == _CONFIG_CACHE["mtime"]:
+        return copy.deepcopy(_CONFIG_CACHE["data"])
+
     try:
-        with open(CONFIG_PATH, 'r') as f:
-            config = json.load(f)
-            # Merge with defaults to ensure all keys exist
-            for key, value in DEFAULT_CONFIG.items():
-                if key not in config:
-                    config[key] = value
-            return config
+        with open(CONFIG_PATH, 'rb') as f:
+            raw = f.read()
+        config = orjson.loads(raw) if orjson else json.loads(raw)
+        # Merge with defaults to ensure all keys exist
+        for key in DEFAULT_CONFIG.keys() - config.keys():
+            config[key] = DEFAULT_CONFIG[key]
+        _CONFIG_CACHE["mtime"] = mtime
+        _CONFIG_CACHE["data"] = config
+        return copy.deepcopy(config)
     except Exception as e:
         logger.error(f"Error loading config: {e}, using defaults")
         return DEFAULT_CONFIG.copy()
@@ -83,15 +134,402 @@ def load_config() -> Dict[str, Any]:
 def save_config(config: Dict[str, Any]) -> bool:
     """Save config to JSON."""
     try:
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(CONFIG_PATH, 'w') as f:
-            json.dump(config, f, indent=2)
+        _ensure_data_dir()
+        if orjson:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode('utf-8')
+        # Write-then-rename so a crash never leaves a truncated config behind
+        tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, CONFIG_PATH)
+        # Coarse filesystem timestamps may not change between quick saves
+        _CONFIG_CACHE["mtime"] = None
         logger.info(f"Config saved to {CONFIG_PATH}")
         return True
     except Exception as e:
         logger.error(f"Error saving config: {e}")
         return False
 
+# ============================================================================
+# ROW TYPES
+# ============================================================================
+class ProspectedAsteroid(NamedTuple):
+    """One unprocessed prospector result (field order matches the SELECT)."""
+    id: int
+    timestamp: Optional[str]
+    journal_timestamp: Optional[str]
+    material_name: Optional[str]
+    percentage: Optional[float]
+    is_motherlode: int
+    content_level: Optional[str]
+    is_surface: int
+    is_deepcore: int
+    remaining: Optional[float]
+    processed: int
+
+
+# ============================================================================
+# SQL HELPERS
+# ============================================================================
+@functools.lru_cache(maxsize=64)
+def _update_sql(table: str, columns: Tuple[str, ...], touch: bool) -> str:
+    """Build (once per column set) the UPDATE statement for a singleton table."""
+    updates = ', '.join(f"{c} = ?" for c in columns)
+    if touch:
+        updates += ", last_updated = CURRENT_TIMESTAMP"
+    return f"UPDATE {table} SET {updates} WHERE id = 1"
+
+
+def _update_args(kwargs: Dict[str, Any]) -> Tuple[Tuple[str, ...], List[Any]]:
+    """Canonicalize kwargs so equal column sets map to the same cached SQL."""
+    columns = tuple(sorted(kwargs))
+    return columns, [kwargs[c] for c in columns]
+
+
+def _split_sql(script: str) -> Iterator[str]:
+    """Split a migration script into statements (trigger bodies stay whole)."""
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ""
+    if statement.strip():
+        yield statement
+
+
+def _is_busy(error: sqlite3.Error) -> bool:
+    """True for SQLITE_BUSY/SQLITE_LOCKED, i.e. errors that succeed if retried later."""
+    code = getattr(error, "sqlite_errorcode", None)  # Python 3.11+
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    return isinstance(error, sqlite3.OperationalError) and "locked" in str(error)
+
+
+# Ids per UPDATE ... IN statement (stays under SQLITE_MAX_VARIABLE_NUMBER on old builds)
+_MARK_CHUNK = 500
+
+
+@functools.lru_cache(maxsize=64)
+def _mark_asteroids_sql(count: int) -> str:
+    """UPDATE marking count asteroid ids processed (one string per distinct count)."""
+    return f"UPDATE prospected_asteroids SET processed = 1 WHERE id IN ({', '.join('?' * count)})"
+
+
+_SELECT_UNPROCESSED_ASTEROIDS = f"""
+    SELECT {', '.join(ProspectedAsteroid._fields)} FROM prospected_asteroids
+    WHERE processed = 0 
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+
+# Keyset pagination starts "after" (since_us, _MAX_ROWID), i.e. strictly after since_us
+_MAX_ROWID = 2 ** 63 - 1
+_SELECT_CHAT_PAGE = """
+    SELECT * FROM chat_messages
+    WHERE (journal_ts_us, id) > (?, ?)
+    ORDER BY journal_ts_us ASC, id ASC
+    LIMIT ?
+"""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _journal_ts_us(ts: str) -> Optional[int]:
+    """Convert a journal ISO-8601 timestamp (UTC, 'Z' suffix) to epoch microseconds."""
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_US
+
+# Sender-based chat subtypes; security tokens win over pirate tokens anywhere
+# in the name (group 1 = sec, group 2 = pirate)
+_CHAT_SENDER_RE = re.compile(
+    r"(?:.*?(security|system defence)|.*?(pirate|wing))",
+    re.IGNORECASE | re.DOTALL
+)
+_CHAT_CHANNEL_SUBTYPE = {
+    "system": "system",
+    "local": "system",
+    "squadron": "sq",
+    "friend": "friends",
+}
+
+_INSERT_FSS_SIGNAL = """
+    INSERT INTO fss_signals 
+    (signal_name, signal_type, is_station, system_address, system_name, journal_timestamp, last_seen)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_INSERT_PROSPECTED_ASTEROID = """
+    INSERT INTO prospected_asteroids 
+    (timestamp, journal_timestamp, material_name, percentage, 
+     is_motherlode, content_level, is_surface, is_deepcore, remaining, processed)
+    VALUES (CURRENT_TIMESTAMP, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+"""
+
+_INSERT_CHAT_MESSAGE = """
+    INSERT INTO chat_messages
+    (journal_timestamp, channel, from_localised, message_localised, subtype, journal_ts_us, last_seen)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+_INSERT_REFINED_MATERIAL = """
+    INSERT INTO refined_materials 
+    (timestamp, journal_timestamp, material_name, material_type)
+    VALUES (CURRENT_TIMESTAMP, ?, ?, ?)
+"""
+
+_UPSERT_FLEET_CARRIER = """
+    INSERT INTO fleet_carriers 
+    (signal_name, system_address, system_name, discovered_timestamp, last_seen)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(signal_name) DO UPDATE SET
+        system_address = excluded.system_address,
+        system_name = excluded.system_name,
+        last_seen = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_MATERIAL_CONFIG = """
+    INSERT INTO material_config 
+    (material_name, min_percentage, target_price, track_surface, track_deepcore, enabled)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(material_name) DO UPDATE SET
+        min_percentage = excluded.min_percentage,
+        target_price = excluded.target_price,
+        track_surface = excluded.track_surface,
+        track_deepcore = excluded.track_deepcore,
+        enabled = excluded.enabled
+"""
+
+# Scan tab snapshot in one statement; the _ship_status marker column splits the two tables
+_DASHBOARD_SNAPSHOT = """
+    SELECT g.*, NULL AS _ship_status, s.*,
+           (SELECT COALESCE(SUM(n), 0) FROM refined_counts)
+    FROM game_state g, ship_status s
+    WHERE g.id = 1 AND s.id = 1
+"""
+
+
+# Base (v1) schema; idempotent, so it also adopts pre-versioning databases
+_SCHEMA_SQL = """
+    -- Game state table
+    CREATE TABLE IF NOT EXISTS game_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        commander_name TEXT,
+        current_system TEXT,
+        log_file_path TEXT,
+        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    INSERT OR IGNORE INTO game_state (id, commander_name, current_system)
+    VALUES (1, 'Unknown', 'Unknown');
+
+    -- Ship status table
+    CREATE TABLE IF NOT EXISTS ship_status (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        cargo_capacity INTEGER DEFAULT 0,
+        cargo_count INTEGER DEFAULT 0,
+        limpet_count INTEGER DEFAULT 0,
+        commander_credits INTEGER DEFAULT 0,
+        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    INSERT OR IGNORE INTO ship_status (id) VALUES (1);
+
+    -- Fleet carriers table
+    CREATE TABLE IF NOT EXISTS fleet_carriers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        signal_name TEXT UNIQUE,
+        system_address INTEGER,
+        system_name TEXT,
+        discovered_timestamp TEXT,
+        last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- FSS signals table
+    CREATE TABLE IF NOT EXISTS fss_signals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        signal_name TEXT,
+        signal_type TEXT,
+        is_station INTEGER,
+        system_address INTEGER,
+        system_name TEXT,
+        journal_timestamp TEXT,
+        last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Prospected asteroids table
+    CREATE TABLE IF NOT EXISTS prospected_asteroids (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TIMESTAMP,
+        journal_timestamp TEXT,
+        material_name TEXT,
+        percentage REAL,
+        is_motherlode INTEGER DEFAULT 0,
+        content_level TEXT,
+        is_surface INTEGER DEFAULT 1,
+        is_deepcore INTEGER DEFAULT 0,
+        remaining REAL,
+        processed INTEGER DEFAULT 0
+    );
+
+    -- Refined materials table
+    CREATE TABLE IF NOT EXISTS refined_materials (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        journal_timestamp TEXT,
+        material_name TEXT,
+        material_type TEXT
+    );
+
+    -- Material configuration table
+    CREATE TABLE IF NOT EXISTS material_config (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        material_name TEXT UNIQUE,
+        min_percentage REAL DEFAULT 25.0,
+        target_price INTEGER DEFAULT 0,
+        track_surface INTEGER DEFAULT 1,
+        track_deepcore INTEGER DEFAULT 1,
+        enabled INTEGER DEFAULT 1
+    );
+
+    -- Service status table
+    CREATE TABLE IF NOT EXISTS service_status (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        is_running INTEGER DEFAULT 0,
+        pid INTEGER,
+        last_heartbeat TIMESTAMP,
+        journal_file TEXT,
+        scan_interval REAL DEFAULT 0.5
+    );
+    INSERT OR IGNORE INTO service_status (id, is_running, last_heartbeat)
+    VALUES (1, 0, CURRENT_TIMESTAMP);
+
+    -- Location history table
+    CREATE TABLE IF NOT EXISTS location_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        journal_timestamp TEXT,
+        system_name TEXT,
+        full_json TEXT,
+        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Chat messages table
+    CREATE TABLE IF NOT EXISTS chat_messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        journal_timestamp TEXT,
+        channel TEXT,
+        from_localised TEXT,
+        message_localised TEXT,
+        subtype TEXT DEFAULT 'other',
+        last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Indexes for the hot polling queries
+    CREATE INDEX IF NOT EXISTS idx_prospected_unprocessed
+    ON prospected_asteroids (timestamp DESC) WHERE processed = 0;
+    CREATE INDEX IF NOT EXISTS idx_chat_ts
+    ON chat_messages (journal_timestamp);
+    CREATE INDEX IF NOT EXISTS idx_fss_station
+    ON fss_signals (is_station, last_seen DESC);
+"""
+
+# Schema migrations, keyed by the user_version they upgrade to
+_MIGRATIONS = {
+    1: _SCHEMA_SQL,
+    # v2: singleton tables become WITHOUT ROWID (one clustered b-tree each)
+    2: """
+        CREATE TABLE game_state_new (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            commander_name TEXT,
+            current_system TEXT,
+            log_file_path TEXT,
+            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID;
+        INSERT INTO game_state_new
+            SELECT id, commander_name, current_system, log_file_path, last_updated
+            FROM game_state;
+        DROP TABLE game_state;
+        ALTER TABLE game_state_new RENAME TO game_state;
+
+        CREATE TABLE ship_status_new (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            cargo_capacity INTEGER DEFAULT 0,
+            cargo_count INTEGER DEFAULT 0,
+            limpet_count INTEGER DEFAULT 0,
+            commander_credits INTEGER DEFAULT 0,
+            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID;
+        INSERT INTO ship_status_new
+            SELECT id, cargo_capacity, cargo_count, limpet_count, commander_credits, last_updated
+            FROM ship_status;
+        DROP TABLE ship_status;
+        ALTER TABLE ship_status_new RENAME TO ship_status;
+
+        CREATE TABLE service_status_new (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            is_running INTEGER DEFAULT 0,
+            pid INTEGER,
+            last_heartbeat TIMESTAMP,
+            journal_file TEXT,
+            scan_interval REAL DEFAULT 0.5
+        ) WITHOUT ROWID;
+        INSERT INTO service_status_new
+            SELECT id, is_running, pid, last_heartbeat, journal_file, scan_interval
+            FROM service_status;
+        DROP TABLE service_status;
+        ALTER TABLE service_status_new RENAME TO service_status;
+    """,
+    # v3: per-material refined counts kept current by triggers
+    3: """
+        CREATE TABLE IF NOT EXISTS refined_counts (
+            material_name TEXT PRIMARY KEY,
+            n INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+        INSERT OR REPLACE INTO refined_counts (material_name, n)
+            SELECT COALESCE(material_name, ''), COUNT(*)
+            FROM refined_materials GROUP BY 1;
+
+        CREATE TRIGGER IF NOT EXISTS trg_refined_ins
+        AFTER INSERT ON refined_materials
+        BEGIN
+            INSERT INTO refined_counts (material_name, n)
+            VALUES (COALESCE(new.material_name, ''), 1)
+            ON CONFLICT(material_name) DO UPDATE SET n = n + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_refined_del
+        AFTER DELETE ON refined_materials
+        BEGIN
+            UPDATE refined_counts SET n = n - 1
+            WHERE material_name = COALESCE(old.material_name, '');
+        END;
+    """,
+    # v4: chat keyset pagination on INTEGER epoch-microseconds instead of ISO text
+    4: """
+        ALTER TABLE chat_messages ADD COLUMN journal_ts_us INTEGER;
+        UPDATE chat_messages SET journal_ts_us =
+            CAST(strftime('%s', journal_timestamp) AS INTEGER) * 1000000
+            + CAST(substr(strftime('%f', journal_timestamp), 4) AS INTEGER) * 1000
+        WHERE journal_timestamp IS NOT NULL;
+        DROP INDEX IF EXISTS idx_chat_ts;
+        CREATE INDEX IF NOT EXISTS idx_chat_ts_us ON chat_messages (journal_ts_us);
+    """,
+    # v5: range seeks for per-material and motherlode history queries
+    5: """
+        CREATE INDEX IF NOT EXISTS idx_prospected_mat_ts
+        ON prospected_asteroids (material_name, timestamp DESC);
+        CREATE INDEX IF NOT EXISTS idx_prospected_motherlode_ts
+        ON prospected_asteroids (timestamp DESC) WHERE is_motherlode = 1;
+    """,
+}
+
+
 # ============================================================================
 # DATABASE MANAGER CLASS
 # ============================================================================
@@ -104,425 +542,692 @@ class DatabaseManager:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize database connection."""
         self.db_path = str(db_path or DB_PATH)
-        self.connection: Optional[sqlite3.Connection] = None
-        self._connect()
+        # One connection per thread (all on the same WAL file) so UI reads
+        # never queue behind the journal writer on a shared connection
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Journal inserts are queued to a writer thread so callers never wait on fsync
+        self._write_queue: "queue.Queue[Optional[Tuple[str, Tuple]]]" = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Rows the writer thread could not commit, reported (and reset) by flush()
+        self._lost_writes = 0
         self._create_tables()
+        self._optimize_on_open()
         logger.info(f"DatabaseManager initialized: {self.db_path}")
 
-    def _connect(self) -> None:
-        """Establish database connection with proper settings."""
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection owned by the calling thread (opened on first use)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        """Establish this thread's database connection with proper settings."""
         try:
-            DATA_DIR.mkdir(exist_ok=True)
-            self.connection = sqlite3.connect(
+            _ensure_data_dir()
+            connection = sqlite3.connect(
                 self.db_path,
                 check_same_thread=False,
-                timeout=10.0
+                timeout=10.0,
+                cached_statements=256
             )
-            self.connection.row_factory = sqlite3.Row
-            self.connection.execute("PRAGMA journal_mode=WAL")
-            self.connection.execute("PRAGMA busy_timeout=5000")
-            logger.info("Database connection established")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            # WAL makes synchronous=NORMAL crash-safe: fsync only at checkpoint
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+            connection.execute("PRAGMA temp_store=MEMORY")
+            connection.execute("PRAGMA mmap_size=268435456")  # 256 MB
+            # Checkpoint every ~1000 pages; the log reader's small, frequent
+            # commits keep each checkpoint (and its pause) short
+            connection.execute("PRAGMA wal_autocheckpoint=1000")
+            # Bound the ANALYZE work PRAGMA optimize may do (at startup and on close)
+            connection.execute("PRAGMA analysis_limit=400")
+
+            self._local.connection = connection
+            self._local.batch_depth = 0
+            self._local.batch_rows = 0
+            self._local.batch_started = 0.0
+            # Read cache, valid while PRAGMA data_version is unchanged
+            self._local.cache = {}
+            self._local.data_version = None
+            with self._connections_lock:
+                self._connections.append(connection)
+            logger.info(f"Database connection established ({threading.current_thread().name})")
+            return connection
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
 
     def _create_tables(self) -> None:
-        """Create all required tables (idempotent)."""
+        """Create all required tables and apply pending migrations."""
         try:
-            cursor = self.connection.cursor()
-
-            # Game state table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS game_state (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    commander_name TEXT,
-                    current_system TEXT,
-                    log_file_path TEXT,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            cursor.execute("""
-                INSERT OR IGNORE INTO game_state (id, commander_name, current_system)
-                VALUES (1, 'Unknown', 'Unknown')
-            """)
-
-            # Ship status table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS ship_status (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    cargo_capacity INTEGER DEFAULT 0,
-                    cargo_count INTEGER DEFAULT 0,
-                    limpet_count INTEGER DEFAULT 0,
-                    commander_credits INTEGER DEFAULT 0,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            cursor.execute("INSERT OR IGNORE INTO ship_status (id) VALUES (1)")
-
-            # Fleet carriers table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS fleet_carriers (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    signal_name TEXT UNIQUE,
-                    system_address INTEGER,
-                    system_name TEXT,
-                    discovered_timestamp TEXT,
-                    last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # FSS signals table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS fss_signals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    signal_name TEXT,
-                    signal_type TEXT,
-                    is_station INTEGER,
-                    system_address INTEGER,
-                    system_name TEXT,
-                    journal_timestamp TEXT,
-                    last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Prospected asteroids table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS prospected_asteroids (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TIMESTAMP,
-                    journal_timestamp TEXT,
-                    material_name TEXT,
-                    percentage REAL,
-                    is_motherlode INTEGER DEFAULT 0,
-                    content_level TEXT,
-                    is_surface INTEGER DEFAULT 1,
-                    is_deepcore INTEGER DEFAULT 0,
-                    remaining REAL,
-                    processed INTEGER DEFAULT 0
-                )
-            """)
-
-            # Refined materials table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS refined_materials (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    journal_timestamp TEXT,
-                    material_name TEXT,
-                    material_type TEXT
-                )
-            """)
-
-            # Material configuration table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS material_config (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    material_name TEXT UNIQUE,
-                    min_percentage REAL DEFAULT 25.0,
-                    target_price INTEGER DEFAULT 0,
-                    track_surface INTEGER DEFAULT 1,
-                    track_deepcore INTEGER DEFAULT 1,
-                    enabled INTEGER DEFAULT 1
-                )
-            """)
-
-            # Service status table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS service_status (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    is_running INTEGER DEFAULT 0,
-                    pid INTEGER,
-                    last_heartbeat TIMESTAMP,
-                    journal_file TEXT,
-                    scan_interval REAL DEFAULT 0.5
-                )
-            """)
-            cursor.execute("""
-                INSERT OR IGNORE INTO service_status (id, is_running, last_heartbeat)
-                VALUES (1, 0, CURRENT_TIMESTAMP)
-            """)
-
-            # Location history table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS location_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    journal_timestamp TEXT,
-                    system_name TEXT,
-                    full_json TEXT,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Chat messages table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS chat_messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    journal_timestamp TEXT,
-                    channel TEXT,
-                    from_localised TEXT,
-                    message_localised TEXT,
-                    subtype TEXT DEFAULT 'other',
-                    last_seen TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            self.connection.commit()
-            logger.info("All database tables created/verified")
+            connection = self.connection
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                logger.info(f"Database schema up to date (v{version})")
+                return
+
+            # The UI and the log reader start together: take the write lock first and
+            # re-read the version under it, so only one process applies each step.
+            # Statements run one by one (executescript would commit the lock away).
+            connection.execute("BEGIN IMMEDIATE")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            for target in range(version + 1, SCHEMA_VERSION + 1):
+                for statement in _split_sql(_MIGRATIONS[target]):
+                    connection.execute(statement)
+                connection.execute(f"PRAGMA user_version = {target}")
+                logger.info(f"Database migrated to v{target}")
+            connection.commit()
+
+            logger.info(f"All database tables created/verified (v{SCHEMA_VERSION})")
         except sqlite3.Error as e:
+            if self.connection.in_transaction:
+                self.connection.rollback()
             logger.error(f"Error creating tables: {e}")
             raise
 
+    def _optimize_on_open(self) -> None:
+        """
+        Refresh planner statistics once per process, after migrations.
+
+        0x10002 is SQLite's recommended mask for a newly opened long-lived
+        connection: it checks every table rather than only those this
+        connection has queried (which, on open, is none).
+        """
+        try:
+            self.connection.execute("PRAGMA optimize=0x10002")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+
+    # ========================================================================
+    # TRANSACTION BATCHING
+    # ========================================================================
+    def begin_batch(self) -> None:
+        """
+        Start a write batch; per-row methods stop committing until end_batch().
+
+        The write lock is only taken by the batch's first synchronous write, so a
+        batch whose rows all go through the writer thread never blocks it.
+        """
+        self.connection  # Open this thread's connection (and its batch state)
+        local = self._local
+        if local.batch_depth == 0:
+            local.batch_rows = 0
+        local.batch_depth += 1
+
+    def end_batch(self, rollback: bool = False) -> None:
+        """Finish a write batch, committing (or rolling back) the outermost one."""
+        local = self._local
+        if getattr(local, "batch_depth", 0) == 0:
+            return
+        local.batch_depth -= 1
+        if local.batch_depth == 0:
+            if rollback:
+                local.connection.rollback()
+                local.cache.clear()
+            else:
+                local.connection.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group many writes into a single transaction.
+
+        Usage:
+            with db.batch():
+                for event in events:
+                    db.add_chat_message(event)
+        """
+        self.begin_batch()
+        try:
+            yield self
+        except Exception:
+            self.end_batch(rollback=True)
+            raise
+        self.end_batch()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Scope one mutation on this thread's connection.
+
+        Outside a batch the connection's own context manager commits on success
+        and rolls back on error, so a failed write never leaves a transaction
+        open to pin the WAL. Inside a batch the commit is deferred to it.
+        """
+        connection = self.connection
+        local = self._local
+        if local.batch_depth:
+            if not connection.in_transaction:
+                connection.execute("BEGIN IMMEDIATE")
+                local.batch_started = time.monotonic()
+            yield connection
+            self._commit()
+            return
+        with connection:
+            yield connection
+
+    def _commit(self) -> None:
+        """Commit now, or defer to the active batch (autoflushing large/old batches)."""
+        local = self._local
+        if local.batch_depth == 0:
+            local.connection.commit()
+            return
+
+        local.batch_rows += 1
+        if (local.batch_rows >= BATCH_AUTOFLUSH_ROWS or
+                time.monotonic() - local.batch_started >= BATCH_AUTOFLUSH_SECONDS):
+            # The next write in the batch reopens the transaction
+            local.connection.commit()
+            local.batch_rows = 0
+
+    # ========================================================================
+    # BACKGROUND WRITER
+    # ========================================================================
+    def _enqueue_write(self, sql: str, params: Tuple) -> None:
+        """Queue one write for the writer thread (started on first use)."""
+        self._enqueue_writes(sql, (params,))
+
+    def _enqueue_writes(self, sql: str, rows) -> None:
+        """Queue writes of one statement for the writer thread (started on first use)."""
+        if self._writer_thread is None:
+            with self._writer_lock:
+                if self._writer_thread is None:
+                    self._writer_thread = threading.Thread(
+                        target=self._writer_loop, name="db-writer", daemon=True
+                    )
+                    self._writer_thread.start()
+        # The writer needs the write lock to commit what we queue: never keep this
+        # thread's batch transaction open past its autoflush age or across a full queue
+        local = self._local
+        if (getattr(local, "batch_depth", 0) and
+                time.monotonic() - local.batch_started >= BATCH_AUTOFLUSH_SECONDS):
+            self._release_batch_lock()
+        for params in rows:
+            try:
+                self._write_queue.put_nowait((sql, params))
+            except queue.Full:
+                self._release_batch_lock()
+                self._write_queue.put((sql, params))
+
+    def _release_batch_lock(self) -> None:
+        """Commit this thread's open batch transaction (its next write reopens it)."""
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is not None and local.batch_depth and connection.in_transaction:
+            connection.commit()
+            local.batch_rows = 0
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue in batches of up to WRITER_BATCH_ROWS / WRITER_BATCH_SECONDS."""
+        write_queue = self._write_queue
+        stopping = False
+        while not stopping:
+            item = write_queue.get()
+            if item is None:
+                write_queue.task_done()
+                break
+            pending = [item]
+            deadline = time.monotonic() + WRITER_BATCH_SECONDS
+            while len(pending) < WRITER_BATCH_ROWS:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = write_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
+
+            self._write_pending(pending)
+            for _ in range(len(pending) + stopping):
+                write_queue.task_done()
+
+    def _write_pending(self, pending: List[Tuple[str, Tuple]]) -> None:
+        """
+        Run queued writes in one transaction, one executemany per statement run.
+
+        A busy/locked database keeps the batch and retries it with backoff; any
+        other error replays it row by row so only the rows SQLite rejects are lost.
+        """
+        connection = self.connection
+        delay = WRITER_RETRY_DELAY
+        deadline = time.monotonic() + WRITER_RETRY_SECONDS
+        while True:
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                for sql, group in itertools.groupby(pending, key=lambda item: item[0]):
+                    connection.executemany(sql, [params for _, params in group])
+                connection.commit()
+                return
+            except sqlite3.Error as e:
+                if connection.in_transaction:
+                    connection.rollback()
+                if not _is_busy(e):
+                    logger.warning(f"Background write of {len(pending)} rows failed ({e}), retrying row by row")
+                    break
+                if time.monotonic() + delay > deadline:
+                    logger.error(f"Background write of {len(pending)} rows lost: database busy "
+                                 f"for {WRITER_RETRY_SECONDS:.0f}s ({e})")
+                    self._count_lost_writes(len(pending))
+                    return
+                logger.debug(f"Background write busy ({e}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+                delay = min(delay * 2, WRITER_RETRY_MAX_DELAY)
+        self._write_rows(pending)
+
+    def _write_rows(self, pending: List[Tuple[str, Tuple]]) -> None:
+        """Replay a failed batch one row at a time, logging and skipping rejected rows."""
+        connection = self.connection
+        rejected = 0
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            for sql, params in pending:
+                try:
+                    connection.execute(sql, params)
+                except sqlite3.Error as e:
+                    if _is_busy(e):
+                        raise
+                    # A failed statement is undone on its own; the transaction stays open
+                    logger.error(f"Background write rejected ({e}), row dropped: {params!r}")
+                    rejected += 1
+            connection.commit()
+        except sqlite3.Error as e:
+            if connection.in_transaction:
+                connection.rollback()
+            logger.error(f"Background write of {len(pending)} rows lost: {e}")
+            rejected = len(pending)
+        if rejected:
+            self._count_lost_writes(rejected)
+
+    def _count_lost_writes(self, count: int) -> None:
+        """Record rows the writer thread gave up on."""
+        with self._writer_lock:
+            self._lost_writes += count
+
+    def pop_lost_writes(self) -> int:
+        """Number of queued rows the writer failed to commit since the last call."""
+        with self._writer_lock:
+            lost, self._lost_writes = self._lost_writes, 0
+        return lost
+
+    def flush(self) -> int:
+        """Block until every queued write has been handled; returns the rows lost meanwhile."""
+        if self._writer_thread is not None:
+            self._write_queue.join()
+        return self.pop_lost_writes()
+
+    def data_version(self) -> int:
+        """
+        PRAGMA data_version for this thread's connection.
+
+        It changes whenever another connection (the log reader process or the
+        writer thread) commits, so pollers can skip ticks where nothing changed.
+        """
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _cached(self, key: str, loader):
+        """
+        Return this thread's cached result for key, reloading it when needed.
+
+        PRAGMA data_version changes whenever another connection (the log reader
+        process or another thread) commits; own writes clear the cache directly.
+        """
+        connection = self.connection
+        local = self._local
+        version = connection.execute("PRAGMA data_version").fetchone()[0]
+        if version != local.data_version:
+            local.cache.clear()
+            local.data_version = version
+        value = local.cache.get(key)
+        if value is None:
+            value = local.cache[key] = loader()
+        return value
+
+    def _fetch_dicts(self, sql: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        """Run a query and build row dicts from plain tuples and one shared key tuple."""
+        cursor = self.connection.execute(sql, params)
+        columns = tuple(d[0] for d in cursor.description)
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def _fetch_one(self, table: str) -> Dict[str, Any]:
+        """Fetch the single row of a singleton table as a dict ({} if missing)."""
+        rows = self._fetch_dicts(f"SELECT * FROM {table} WHERE id = 1")
+        return rows[0] if rows else {}
+
     # ========================================================================
     # GAME STATE METHODS
     # ========================================================================
     def get_game_state(self) -> Dict[str, Any]:
-        """Get current game state."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM game_state WHERE id = 1")
-        row = cursor.fetchone()
-        return dict(row) if row else {}
+        """Get current game state (cached until the table changes)."""
+        return dict(self._cached("game_state", lambda: self._fetch_one("game_state")))
 
     def update_game_state(self, **kwargs) -> None:
         """Update game state fields."""
-        cursor = self.connection.cursor()
-        updates = ', '.join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values())
-        cursor.execute(f"""
-            UPDATE game_state SET {updates}, last_updated = CURRENT_TIMESTAMP
-            WHERE id = 1
-        """, values)
-        self.connection.commit()
+        columns, values = _update_args(kwargs)
+        with self._transaction() as connection:
+            connection.execute(_update_sql("game_state", columns, True), values)
+        self._local.cache.pop("game_state", None)
 
     # ========================================================================
     # SHIP STATUS METHODS
     # ========================================================================
     def get_ship_status(self) -> Dict[str, Any]:
-        """Get current ship status."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM ship_status WHERE id = 1")
-        row = cursor.fetchone()
-        return dict(row) if row else {}
+        """Get current ship status (cached until the table changes)."""
+        return dict(self._cached("ship_status", lambda: self._fetch_one("ship_status")))
 
     def update_ship_status(self, **kwargs) -> None:
         """Update ship status fields."""
-        cursor = self.connection.cursor()
-        updates = ', '.join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values())
-        cursor.execute(f"""
-            UPDATE ship_status SET {updates}, last_updated = CURRENT_TIMESTAMP
-            WHERE id = 1
-        """, values)
-        self.connection.commit()
+        columns, values = _update_args(kwargs)
+        with self._transaction() as connection:
+            connection.execute(_update_sql("ship_status", columns, True), values)
+        self._local.cache.pop("ship_status", None)
+
+    def get_dashboard_snapshot(self) -> Dict[str, Any]:
+        """
+        Read game state, ship status and the refined total in one round-trip.
+
+        Returns {'state': {...}, 'ship_status': {...}, 'refined_count': int}.
+        """
+        cursor = self.connection.execute(_DASHBOARD_SNAPSHOT)
+        row = cursor.fetchone()
+        if row is None:
+            return {'state': {}, 'ship_status': {}, 'refined_count': 0}
+        columns = [d[0] for d in cursor.description]
+        split = columns.index("_ship_status")
+        return {
+            'state': dict(zip(columns[:split], row[:split])),
+            'ship_status': dict(zip(columns[split + 1:-1], row[split + 1:-1])),
+            'refined_count': row[-1],
+        }
 
     # ========================================================================
     # FLEET CARRIER METHODS
     # ========================================================================
     def get_fleet_carriers(self) -> List[Dict[str, Any]]:
         """Get all fleet carriers."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
+        return self._fetch_dicts("""
             SELECT * FROM fleet_carriers 
             ORDER BY last_seen DESC
         """)
-        return [dict(row) for row in cursor.fetchall()]
 
     def add_fleet_carrier(self, signal_name: str, system_address: int, 
                          system_name: str, discovered_timestamp: str) -> None:
         """Add or update fleet carrier."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO fleet_carriers 
-            (signal_name, system_address, system_name, discovered_timestamp, last_seen)
-            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (signal_name, system_address, system_name, discovered_timestamp))
-        self.connection.commit()
+        with self._transaction() as connection:
+            connection.execute(_UPSERT_FLEET_CARRIER, (signal_name, system_address, system_name, discovered_timestamp))
 
     # ========================================================================
     # FSS SIGNALS / STATIONS METHODS
     # ========================================================================
     def get_stations(self) -> List[Dict[str, Any]]:
         """Get all station signals (excluding fleet carriers)."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
+        return self._fetch_dicts("""
             SELECT * FROM fss_signals 
             WHERE is_station = 1 AND signal_type != 'FleetCarrier'
             ORDER BY last_seen DESC
         """)
-        return [dict(row) for row in cursor.fetchall()]
 
     def add_fss_signal(self, signal_name: str, signal_type: str, is_station: bool,
                        system_address: int, system_name: str, journal_timestamp: str) -> None:
-        """Add FSS signal."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            INSERT INTO fss_signals 
-            (signal_name, signal_type, is_station, system_address, system_name, journal_timestamp, last_seen)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (signal_name, signal_type, int(is_station), system_address, system_name, journal_timestamp))
-        self.connection.commit()
+        """Add FSS signal (committed asynchronously by the writer thread)."""
+        self._enqueue_write(_INSERT_FSS_SIGNAL, (signal_name, signal_type, int(is_station), system_address, system_name, journal_timestamp))
+
+    def add_fss_signals_bulk(self, rows: List[Tuple]) -> None:
+        """
+        Add many FSS signals in one executemany.
+
+        Each row is (signal_name, signal_type, is_station, system_address,
+        system_name, journal_timestamp).
+        """
+        if not rows:
+            return
+        with self._transaction() as connection:
+            connection.executemany(_INSERT_FSS_SIGNAL, rows)
 
     # ========================================================================
     # PROSPECTED ASTEROIDS METHODS
     # ========================================================================
-    def get_unprocessed_asteroids(self, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_unprocessed_asteroids(self, limit: int = 100) -> List[ProspectedAsteroid]:
         """Get unprocessed asteroid scans."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT * FROM prospected_asteroids 
-            WHERE processed = 0 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-        """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        cursor = self.connection.execute(_SELECT_UNPROCESSED_ASTEROIDS, (limit,))
+        return list(map(ProspectedAsteroid._make, cursor))
+
+    def get_unprocessed_asteroids_columnar(self, limit: int = 100) -> Dict[str, Any]:
+        """
+        Get unprocessed asteroid scans as one sequence per column (for bulk analysis).
+
+        id is an array('q'); percentage and remaining are array('d') with NULL
+        as NaN, so they can be wrapped by numpy.frombuffer without copying.
+        """
+        columns = ProspectedAsteroid._fields
+        rows = self.connection.execute(_SELECT_UNPROCESSED_ASTEROIDS, (limit,)).fetchall()
+        if rows:
+            data = {c: list(values) for c, values in zip(columns, zip(*rows))}
+        else:
+            data = {c: [] for c in columns}
+        nan = float("nan")
+        data["id"] = array.array("q", data["id"])
+        for c in ("percentage", "remaining"):
+            data[c] = array.array("d", (nan if v is None else v for v in data[c]))
+        return data
+
+    def add_prospected_asteroids_bulk(self, rows: List[Tuple]) -> None:
+        """
+        Add many prospected asteroid materials (committed asynchronously by the
+        writer thread, in one executemany with the rest of its batch).
+
+        Each row is (journal_timestamp, material_name, percentage, is_motherlode,
+        content_level, is_surface, is_deepcore, remaining).
+        """
+        if not rows:
+            return
+        self._enqueue_writes(_INSERT_PROSPECTED_ASTEROID, rows)
 
     def mark_asteroid_processed(self, asteroid_id: int) -> None:
         """Mark asteroid as processed."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            UPDATE prospected_asteroids SET processed = 1 WHERE id = ?
-        """, (asteroid_id,))
-        self.connection.commit()
+        self.mark_asteroids_processed([asteroid_id])
+
+    def mark_asteroids_processed(self, asteroid_ids: List[int]) -> None:
+        """Mark many asteroids as processed with one UPDATE ... IN per chunk and a single commit."""
+        if not asteroid_ids:
+            return
+        with self._transaction() as connection:
+            for start in range(0, len(asteroid_ids), _MARK_CHUNK):
+                chunk = asteroid_ids[start:start + _MARK_CHUNK]
+                connection.execute(_mark_asteroids_sql(len(chunk)), chunk)
 
     def clear_asteroids(self) -> None:
         """Clear all asteroid records."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM prospected_asteroids")
-        self.connection.commit()
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM prospected_asteroids")
 
     # ========================================================================
     # REFINED MATERIALS METHODS
     # ========================================================================
     def get_refined_materials_count(self, material_name: Optional[str] = None) -> int:
-        """Get count of refined materials."""
-        cursor = self.connection.cursor()
+        """Get count of refined materials (read from the trigger-maintained refined_counts)."""
         if material_name:
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM refined_materials 
+            row = self.connection.execute("""
+                SELECT n as count FROM refined_counts
                 WHERE material_name = ?
-            """, (material_name,))
-        else:
-            cursor.execute("SELECT COUNT(*) as count FROM refined_materials")
-        return cursor.fetchone()['count']
+            """, (material_name,)).fetchone()
+            return row[0] if row else 0
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(n), 0) as count FROM refined_counts").fetchone()[0]
+
+    def add_refined_material(self, journal_timestamp: str, material_name: str,
+                             material_type: str = "mining") -> None:
+        """Add refined material (committed asynchronously by the writer thread)."""
+        self._enqueue_write(_INSERT_REFINED_MATERIAL, (journal_timestamp, material_name, material_type))
+
+    def add_refined_materials_bulk(self, rows: List[Tuple]) -> None:
+        """
+        Add many refined materials (committed asynchronously by the writer thread).
+
+        Each row is (journal_timestamp, material_name, material_type).
+        """
+        if not rows:
+            return
+        self._enqueue_writes(_INSERT_REFINED_MATERIAL, rows)
 
     def clear_refined_materials(self) -> None:
         """Clear refined materials."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM refined_materials")
-        self.connection.commit()
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM refined_materials")
 
     # ========================================================================
     # MATERIAL CONFIG METHODS
     # ========================================================================
     def get_material_config(self, material_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get material configurations."""
-        cursor = self.connection.cursor()
+        """Get material configurations (the full list is cached until the table changes)."""
         if material_name:
-            cursor.execute("""
+            return self._fetch_dicts("""
                 SELECT * FROM material_config WHERE material_name = ?
             """, (material_name,))
-            row = cursor.fetchone()
-            return [dict(row)] if row else []
-        else:
-            cursor.execute("SELECT * FROM material_config ORDER BY material_name")
-            return [dict(row) for row in cursor.fetchall()]
+        configs = self._cached("material_config", lambda: self._fetch_dicts(
+            "SELECT * FROM material_config ORDER BY material_name"))
+        return [dict(config) for config in configs]
 
     def save_material_config(self, material_name: str, min_percentage: float,
                             target_price: int, track_surface: bool, 
                             track_deepcore: bool, enabled: bool = True) -> None:
         """Save or update material configuration."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO material_config 
-            (material_name, min_percentage, target_price, track_surface, track_deepcore, enabled)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (material_name, min_percentage, target_price, 
-              int(track_surface), int(track_deepcore), int(enabled)))
-        self.connection.commit()
+        self.save_material_configs([(material_name, min_percentage, target_price,
+                                     track_surface, track_deepcore, enabled)])
+
+    def save_material_configs(self, rows: List[Tuple]) -> None:
+        """
+        Save or update many material configurations in one executemany and commit.
+
+        Each row is (material_name, min_percentage, target_price, track_surface,
+        track_deepcore, enabled).
+        """
+        if not rows:
+            return
+        with self._transaction() as connection:
+            connection.executemany(_UPSERT_MATERIAL_CONFIG, [
+                (name, min_pct, price, int(surface), int(deepcore), int(enabled))
+                for name, min_pct, price, surface, deepcore, enabled in rows
+            ])
+        self._local.cache.pop("material_config", None)
 
     def delete_material_config(self, material_name: str) -> None:
         """Delete material configuration."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            DELETE FROM material_config WHERE material_name = ?
-        """, (material_name,))
-        self.connection.commit()
+        with self._transaction() as connection:
+            connection.execute("""
+                DELETE FROM material_config WHERE material_name = ?
+            """, (material_name,))
+        self._local.cache.pop("material_config", None)
 
     # ========================================================================
     # SERVICE STATUS METHODS
     # ========================================================================
     def get_service_status(self) -> Dict[str, Any]:
-        """Get log reader service status."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM service_status WHERE id = 1")
-        row = cursor.fetchone()
-        return dict(row) if row else {}
+        """Get log reader service status (cached until the table changes)."""
+        return dict(self._cached("service_status", lambda: self._fetch_one("service_status")))
 
     def update_service_status(self, **kwargs) -> None:
         """Update service status."""
-        cursor = self.connection.cursor()
-        updates = ', '.join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values())
-        cursor.execute(f"""
-            UPDATE service_status SET {updates} WHERE id = 1
-        """, values)
-        self.connection.commit()
+        columns, values = _update_args(kwargs)
+        with self._transaction() as connection:
+            connection.execute(_update_sql("service_status", columns, False), values)
+        self._local.cache.pop("service_status", None)
 
     # ========================================================================
     # CHAT MESSAGES METHODS
     # ========================================================================
-    def get_new_chat_messages(self, since_ts: str = "1970-01-01") -> List[Dict[str, Any]]:
-        """Get chat messages since timestamp."""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT * FROM chat_messages 
-            WHERE journal_timestamp > ? 
-            ORDER BY journal_timestamp ASC
-        """, (since_ts,))
-        return [dict(row) for row in cursor.fetchall()]
+    def get_new_chat_messages(self, since_ts: Union[str, int, Tuple[int, int]] = 0) -> List[Dict[str, Any]]:
+        """Get chat messages since timestamp (ISO string, epoch microseconds or row key)."""
+        return list(self.iter_new_chat_messages(since_ts))
+
+    def iter_new_chat_messages(self, since_ts: Union[str, int, Tuple[int, int]] = 0,
+                               page_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Yield chat messages since timestamp (ISO string or epoch microseconds), oldest first.
+
+        Pages through the table with keyset pagination on (journal_ts_us, id),
+        so memory stays bounded by page_size however large the history is.
+        Pass the (journal_ts_us, id) of the last row seen to resume exactly after
+        it: journal timestamps are whole seconds, so a bare timestamp would skip
+        messages from the same second committed after the previous call.
+        """
+        if isinstance(since_ts, tuple):
+            last_key = since_ts
+        else:
+            since_us = since_ts if isinstance(since_ts, int) else (_journal_ts_us(since_ts) or 0)
+            last_key = (since_us, _MAX_ROWID)
+        while True:
+            page = self._fetch_dicts(_SELECT_CHAT_PAGE, (*last_key, page_size))
+            yield from page
+            if len(page) < page_size:
+                return
+            last_key = (page[-1]["journal_ts_us"], page[-1]["id"])
 
     def add_chat_message(self, data: Dict[str, Any]) -> None:
-        """Add chat message from journal."""
-        cursor = self.connection.cursor()
+        """Add chat message from journal (committed asynchronously by the writer thread)."""
+        self._enqueue_write(_INSERT_CHAT_MESSAGE, self._chat_message_row(data))
+
+    def add_chat_messages(self, events: List[Dict[str, Any]]) -> None:
+        """Add many chat messages from journal with a single executemany."""
+        if not events:
+            return
+        with self._transaction() as connection:
+            connection.executemany(_INSERT_CHAT_MESSAGE,
+                                   [self._chat_message_row(data) for data in events])
+
+    @staticmethod
+    def _chat_message_row(data: Dict[str, Any]) -> Tuple[str, str, str, str, str, Optional[int]]:
+        """Build the chat_messages insert parameters from a ReceiveText event."""
         channel = data.get("Channel", "unknown").lower()
         from_loc = data.get("From_Localised", "Unknown")
         msg_loc = data.get("Message_Localised", "")
         ts = data.get("timestamp", "")
 
         # Determine subtype (sec, pirate, system, squad, friends, other)
-        subtype = "other"
-        msg_lower = msg_loc.lower()
-        if "security" in from_loc.lower() or "system defence" in from_loc.lower():
-            subtype = "sec"
-        elif "pirate" in from_loc.lower() or "wing" in from_loc.lower():
-            subtype = "pirate"
-        elif channel in ["system", "local"]:
-            subtype = "system"
-        elif channel == "squadron":
-            subtype = "sq"
-        elif channel == "friend":
-            subtype = "friends"
-
-        cursor.execute("""
-            INSERT INTO chat_messages 
-            (journal_timestamp, channel, from_localised, message_localised, subtype, last_seen)
-            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (ts, channel, from_loc, msg_loc, subtype))
-        self.connection.commit()
+        match = _CHAT_SENDER_RE.match(from_loc)
+        if match:
+            subtype = "sec" if match.group(1) else "pirate"
+        else:
+            subtype = _CHAT_CHANNEL_SUBTYPE.get(channel, "other")
+
+        return (ts, channel, from_loc, msg_loc, subtype, _journal_ts_us(ts))
 
     def clear_chat_messages(self) -> None:
         """Clear all chat messages."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM chat_messages")
-        self.connection.commit()
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM chat_messages")
 
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
     def close(self) -> None:
-        """Close database connection."""
-        if self.connection:
-            self.connection.close()
-            logger.info("Database connection closed")
+        """Drain queued writes, then close every thread's database connection."""
+        with self._writer_lock:
+            writer, self._writer_thread = self._writer_thread, None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                # Refresh planner statistics for tables whose stats drifted
+                connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
+            connection.close()
+        self._local = threading.local()
+        if connections:
+            logger.info(f"Database connections closed ({len(connections)})")
 
     def __enter__(self):
         return self
@@ -535,12 +1240,15 @@ class DatabaseManager:
 # CONVENIENCE FUNCTIONS - Quick access without instantiating class
 # ============================================================================
 _db_instance = None
+_db_instance_lock = threading.Lock()
 
 def get_db() -> DatabaseManager:
-    """Get singleton database manager instance."""
+    """Get singleton database manager instance (connections are per-thread)."""
     global _db_instance
     if _db_instance is None:
-        _db_instance = DatabaseManager()
+        with _db_instance_lock:
+            if _db_instance is None:
+                _db_instance = DatabaseManager()
     return _db_instance
 
 def init_db() -> DatabaseManager:
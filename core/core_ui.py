@@ -3,44 +3,67 @@ UI Manager - Centralized UI styling and Qt imports
 All Qt imports in one place for easy maintenance and consistency
 """
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+import bisect
+import functools
+import importlib
 import logging
+import re
+import weakref
 
 # ============================================================================
 # CENTRALIZED QT IMPORTS - Import from here in all UI files!
 # ============================================================================
 
-# Core Qt Widgets
+# Eager: needed at boot and by the helpers in this module
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QDialog,
-    QVBoxLayout, QHBoxLayout, QFormLayout, QGridLayout,
-    QLabel, QPushButton, QLineEdit, QTextEdit,
-    QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox,
-    QRadioButton, QSlider, QProgressBar,
-    QTableWidget, QTableWidgetItem, QHeaderView,
-    QListWidget, QListWidgetItem, QTreeWidget, QTreeWidgetItem,
-    QTabWidget, QGroupBox, QFrame, QSplitter,
-    QMenuBar, QMenu, QToolBar, QStatusBar,
-    QFileDialog, QMessageBox, QInputDialog, QColorDialog,
-    QScrollArea, QDockWidget, QMdiArea, QMdiSubWindow
+    QApplication, QMainWindow, QVBoxLayout,
+    QLabel, QPushButton, QProgressBar,
+    QTableWidget, QTableWidgetItem, QHeaderView
 )
-
-# Qt Core
-from PySide6.QtCore import (
-    Qt, QTimer, QThread, Signal, Slot,
-    QUrl, QSettings, QSize, QPoint, QRect,
-    QDateTime, QDate, QTime
-)
-
-# Qt GUI
-from PySide6.QtGui import (
-    QColor, QFont, QPalette, QBrush, QPen,
-    QIcon, QPixmap, QImage, QPainter,
-    QDesktopServices, QKeySequence, QAction
-)
-
-# Import database manager for config loading
-from database_manager import load_config
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QBrush
+
+# Lazy: resolved on first access through the module __getattr__ below
+_LAZY_QT = {
+    "PySide6.QtWidgets": (
+        "QWidget", "QDialog",
+        "QHBoxLayout", "QFormLayout", "QGridLayout",
+        "QLineEdit", "QTextEdit",
+        "QSpinBox", "QDoubleSpinBox", "QComboBox", "QCheckBox",
+        "QRadioButton", "QSlider",
+        "QListWidget", "QListWidgetItem", "QTreeWidget", "QTreeWidgetItem",
+        "QTabWidget", "QGroupBox", "QFrame", "QSplitter",
+        "QMenuBar", "QMenu", "QToolBar", "QStatusBar",
+        "QFileDialog", "QMessageBox", "QInputDialog", "QColorDialog",
+        "QScrollArea", "QDockWidget", "QMdiArea", "QMdiSubWindow",
+    ),
+    "PySide6.QtCore": (
+        "QObject", "QThread", "Signal", "Slot",
+        "QUrl", "QSettings", "QSize", "QPoint", "QRect",
+        "QDateTime", "QDate", "QTime",
+    ),
+    "PySide6.QtGui": (
+        "QPalette", "QPen",
+        "QIcon", "QPixmap", "QImage", "QPainter",
+        "QDesktopServices", "QKeySequence", "QAction",
+    ),
+}
+_LAZY_QT_NAMES = {name: module for module, names in _LAZY_QT.items() for name in names}
+
+
+def __getattr__(name: str):
+    """Resolve a lazily exported Qt class on first access and cache it (PEP 562)."""
+    module = _LAZY_QT_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_QT_NAMES))
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -57,262 +80,357 @@ ED_SUCCESS = "#00FF00"  # Fixed: was _colors.get(...)
 ED_ERROR = "#FF0000"     # Fixed: was _colors.get(...)
 ED_WARNING = "#FFAA00"   # Fixed: was _colors.get(...)
 
+# Label colors served by QLabel[edColor="..."] rules in the base stylesheet
+_ED_COLOR_CLASSES = {
+    ED_ORANGE: "accent",
+    ED_SUCCESS: "success",
+    ED_WARNING: "warning",
+    ED_ERROR: "error",
+}
+
 # ============================================================================
-# STYLESHEET GENERATORS
+# STYLESHEETS - Built once at import; Qt re-parses any new string it is given
 # ============================================================================
 
-def get_base_stylesheet() -> str:
-    """Get base application stylesheet with ED theme."""
-    return f"""
-        QMainWindow {{
-            background-color: {ED_DARK};
+_BASE_TEMPLATE = """
+        QMainWindow {
+            background-color: @dark@;
             color: white;
             font-family: 'Segoe UI', Arial, sans-serif;
             font-size: 10pt;
-        }}
+        }
         
-        QWidget {{
-            background-color: {ED_DARK};
+        QWidget {
+            background-color: @dark@;
             color: white;
-        }}
+        }
         
-        QLabel {{
+        QLabel {
             color: white;
             padding: 2px;
-        }}
+        }
         
-        QPushButton {{
-            background-color: {ED_GRAY};
+        QPushButton {
+            background-color: @gray@;
             color: white;
-            border: 1px solid {ED_ORANGE};
+            border: 1px solid @orange@;
             border-radius: 3px;
             padding: 5px 15px;
             font-weight: bold;
-        }}
+        }
         
-        QPushButton:hover {{
-            background-color: {ED_ORANGE};
+        QPushButton:hover {
+            background-color: @orange@;
             border-color: white;
-        }}
+        }
         
-        QPushButton:pressed {{
+        QPushButton:pressed {
             background-color: #CC5500;
-        }}
+        }
         
-        QPushButton:disabled {{
+        QPushButton:disabled {
             background-color: #2A2A2A;
             border-color: #555555;
             color: #666666;
-        }}
+        }
         
-        QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QTextEdit {{
-            background-color: {ED_GRAY};
+        QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QTextEdit {
+            background-color: @gray@;
             color: white;
-            border: 1px solid {ED_ORANGE};
+            border: 1px solid @orange@;
             border-radius: 3px;
             padding: 3px;
-            selection-background-color: {ED_ORANGE};
-        }}
+            selection-background-color: @orange@;
+        }
         
-        QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
+        QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
             border-color: white;
             border-width: 2px;
-        }}
+        }
         
-        QComboBox::drop-down {{
+        QComboBox::drop-down {
             border: none;
-            background: {ED_ORANGE};
-        }}
+            background: @orange@;
+        }
         
-        QComboBox::down-arrow {{
+        QComboBox::down-arrow {
             image: none;
             border-left: 5px solid transparent;
             border-right: 5px solid transparent;
             border-top: 5px solid white;
             margin-right: 5px;
-        }}
+        }
         
-        QTabWidget::pane {{
-            border: 1px solid {ED_ORANGE};
-            background-color: {ED_DARK};
-        }}
+        QTabWidget::pane {
+            border: 1px solid @orange@;
+            background-color: @dark@;
+        }
         
-        QTabBar::tab {{
-            background-color: {ED_GRAY};
+        QTabBar::tab {
+            background-color: @gray@;
             color: white;
-            border: 1px solid {ED_ORANGE};
+            border: 1px solid @orange@;
             border-bottom: none;
             padding: 8px 20px;
             margin-right: 2px;
-        }}
+        }
         
-        QTabBar::tab:selected {{
-            background-color: {ED_ORANGE};
+        QTabBar::tab:selected {
+            background-color: @orange@;
             font-weight: bold;
-        }}
+        }
         
-        QTabBar::tab:hover {{
+        QTabBar::tab:hover {
             background-color: #CC5500;
-        }}
+        }
         
-        QProgressBar {{
-            border: 1px solid {ED_ORANGE};
+        QProgressBar {
+            border: 1px solid @orange@;
             border-radius: 3px;
             text-align: center;
-            background-color: {ED_GRAY};
+            background-color: @gray@;
             color: white;
             font-weight: bold;
-        }}
+        }
+        
+        QProgressBar::chunk {
+            background-color: @orange@;
+        }
+        
+        QProgressBar[edColor="success"]::chunk {
+            background-color: @success@;
+        }
         
-        QProgressBar::chunk {{
-            background-color: {ED_ORANGE};
-        }}
+        QProgressBar[edColor="warning"]::chunk {
+            background-color: @warning@;
+        }
         
-        QGroupBox {{
-            border: 1px solid {ED_ORANGE};
+        QProgressBar[edColor="error"]::chunk {
+            background-color: @error@;
+        }
+        
+        QGroupBox {
+            border: 1px solid @orange@;
             border-radius: 5px;
             margin-top: 1ex;
             font-weight: bold;
-            color: {ED_ORANGE};
-        }}
+            color: @orange@;
+        }
         
-        QGroupBox::title {{
+        QGroupBox::title {
             subcontrol-origin: margin;
             subcontrol-position: top left;
             padding: 0 5px;
-            color: {ED_ORANGE};
-        }}
+            color: @orange@;
+        }
         
-        QCheckBox {{
+        QCheckBox {
             color: white;
             spacing: 5px;
-        }}
+        }
         
-        QCheckBox::indicator {{
+        QCheckBox::indicator {
             width: 18px;
             height: 18px;
-            border: 1px solid {ED_ORANGE};
+            border: 1px solid @orange@;
             border-radius: 3px;
-            background-color: {ED_GRAY};
-        }}
+            background-color: @gray@;
+        }
         
-        QCheckBox::indicator:checked {{
-            background-color: {ED_ORANGE};
+        QCheckBox::indicator:checked {
+            background-color: @orange@;
             image: none;
-        }}
+        }
         
-        QCheckBox::indicator:hover {{
+        QCheckBox::indicator:hover {
             border-color: white;
-        }}
+        }
         
-        QScrollBar:vertical {{
+        QScrollBar:vertical {
             border: none;
-            background-color: {ED_DARK};
+            background-color: @dark@;
             width: 12px;
             margin: 0;
-        }}
+        }
         
-        QScrollBar::handle:vertical {{
-            background-color: {ED_ORANGE};
+        QScrollBar::handle:vertical {
+            background-color: @orange@;
             min-height: 20px;
             border-radius: 6px;
-        }}
+        }
         
-        QScrollBar::handle:vertical:hover {{
+        QScrollBar::handle:vertical:hover {
             background-color: white;
-        }}
+        }
         
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
             height: 0px;
-        }}
+        }
         
-        QScrollBar:horizontal {{
+        QScrollBar:horizontal {
             border: none;
-            background-color: {ED_DARK};
+            background-color: @dark@;
             height: 12px;
             margin: 0;
-        }}
+        }
         
-        QScrollBar::handle:horizontal {{
-            background-color: {ED_ORANGE};
+        QScrollBar::handle:horizontal {
+            background-color: @orange@;
             min-width: 20px;
             border-radius: 6px;
-        }}
+        }
         
-        QScrollBar::handle:horizontal:hover {{
+        QScrollBar::handle:horizontal:hover {
             background-color: white;
-        }}
+        }
         
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
             width: 0px;
-        }}
+        }
         
-        QMenuBar {{
-            background-color: {ED_DARK};
+        QMenuBar {
+            background-color: @dark@;
             color: white;
-            border-bottom: 1px solid {ED_ORANGE};
-        }}
+            border-bottom: 1px solid @orange@;
+        }
         
-        QMenuBar::item {{
+        QMenuBar::item {
             background-color: transparent;
             padding: 4px 10px;
-        }}
+        }
         
-        QMenuBar::item:selected {{
-            background-color: {ED_ORANGE};
-        }}
+        QMenuBar::item:selected {
+            background-color: @orange@;
+        }
         
-        QMenu {{
-            background-color: {ED_GRAY};
+        QMenu {
+            background-color: @gray@;
             color: white;
-            border: 1px solid {ED_ORANGE};
-        }}
+            border: 1px solid @orange@;
+        }
+        
+        QMenu::item:selected {
+            background-color: @orange@;
+        }
+        
+        QLabel[edColor="accent"] {
+            color: @orange@;
+        }
+        
+        QLabel[edColor="success"] {
+            color: @success@;
+        }
+        
+        QLabel[edColor="warning"] {
+            color: @warning@;
+        }
         
-        QMenu::item:selected {{
-            background-color: {ED_ORANGE};
-        }}
+        QLabel[edColor="error"] {
+            color: @error@;
+        }
     """
 
-
-def get_table_stylesheet() -> str:
-    """Get stylesheet specifically for QTableWidget."""
-    return f"""
-        QTableWidget {{
-            background-color: {ED_DARK};
+_TABLE_TEMPLATE = """
+        QTableWidget {
+            background-color: @dark@;
             color: white;
-            gridline-color: {ED_GRAY};
-            border: 1px solid {ED_ORANGE};
-            selection-background-color: {ED_ORANGE};
+            gridline-color: @gray@;
+            border: 1px solid @orange@;
+            selection-background-color: @orange@;
             selection-color: white;
-        }}
+        }
         
-        QTableWidget::item {{
+        QTableWidget::item {
             padding: 5px;
-        }}
+        }
         
-        QTableWidget::item:alternate {{
+        QTableWidget::item:alternate {
             background-color: #1A1A1A;
-        }}
+        }
         
-        QHeaderView::section {{
-            background-color: {ED_ORANGE};
+        QHeaderView::section {
+            background-color: @orange@;
             color: white;
             padding: 5px;
-            border: 1px solid {ED_DARK};
+            border: 1px solid @dark@;
             font-weight: bold;
-        }}
+        }
         
-        QHeaderView::section:hover {{
+        QHeaderView::section:hover {
             background-color: white;
-            color: {ED_DARK};
-        }}
+            color: @dark@;
+        }
     """
 
+# Theme colors substituted into the templates
+_THEME_TOKENS = {
+    "@dark@": ED_DARK,
+    "@gray@": ED_GRAY,
+    "@orange@": ED_ORANGE,
+    "@success@": ED_SUCCESS,
+    "@warning@": ED_WARNING,
+    "@error@": ED_ERROR,
+}
+
+
+def _apply_theme(template: str) -> str:
+    """Substitute the theme color tokens into a stylesheet template."""
+    for token, color in _THEME_TOKENS.items():
+        template = template.replace(token, color)
+    return template
+
+
+def _minify_qss(sheet: str) -> str:
+    """Collapse whitespace (and drop it around punctuation) so Qt tokenizes less."""
+    sheet = re.sub(r"\s+", " ", sheet)
+    return re.sub(r" ?([{};:,]) ?", r"\1", sheet).strip()
+
+
+_BASE_STYLESHEET = _minify_qss(_apply_theme(_BASE_TEMPLATE))
+_TABLE_STYLESHEET = _minify_qss(_apply_theme(_TABLE_TEMPLATE))
+
+
+def get_base_stylesheet() -> str:
+    """Get base application stylesheet with ED theme."""
+    return _BASE_STYLESHEET
+
+
+def get_table_stylesheet() -> str:
+    """Get stylesheet specifically for QTableWidget."""
+    return _TABLE_STYLESHEET
+
+
+def install_ed_theme(app: Optional[QApplication] = None) -> None:
+    """Apply the ED theme (base + table rules) once, application-wide."""
+    app = app or QApplication.instance()
+    app.setStyleSheet(_BASE_STYLESHEET + _TABLE_STYLESHEET)
+
 
 # ============================================================================
 # WIDGET FACTORY FUNCTIONS
 # ============================================================================
 
+class EDTable(QTableWidget):
+    """QTableWidget with the ED table setup applied in its constructor."""
+
+    def __init__(self, headers: List[str], parent=None,
+                 column_count: Optional[int] = None):
+        column_count = len(headers) if column_count is None else column_count
+        super().__init__(0, column_count, parent)
+        self.setHorizontalHeaderLabels(headers)
+
+        # Styling (colors come from the application-wide theme)
+        self.setAlternatingRowColors(True)
+        self.verticalHeader().setVisible(False)
+        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+
+        # Header stretch (last section stretching overrides its resize mode)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setStretchLastSection(True)
+
+
 def create_ed_table(column_count: int, headers: List[str], parent=None) -> QTableWidget:
     """
     Create a styled QTableWidget with ED theme.
@@ -323,28 +441,26 @@ def create_ed_table(column_count: int, headers: List[str], parent=None) -> QTabl
         parent: Parent widget
     
     Returns:
-        Configured QTableWidget
+        Configured EDTable
     """
-    table = QTableWidget(parent)
-    table.setColumnCount(column_count)
-    table.setHorizontalHeaderLabels(headers)
-    
-    # Styling
-    table.setStyleSheet(get_table_stylesheet())
-    table.setAlternatingRowColors(True)
-    table.verticalHeader().setVisible(False)
-    table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-    table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-    
-    # Header stretch
-    header = table.horizontalHeader()
-    for i in range(column_count):
-        if i == column_count - 1:
-            header.setStretchLastSection(True)
-        else:
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
-    
-    return table
+    return EDTable(headers, parent, column_count)
+
+
+def create_ed_table_row(table: QTableWidget, values, row: Optional[int] = None) -> int:
+    """
+    Fill a row with one QTableWidgetItem per column (appending when row is None).
+
+    Every cell gets an item, padded with empty text, so later coloring never
+    meets a missing item. Returns the row index.
+    """
+    if row is None:
+        row = table.rowCount()
+        table.insertRow(row)
+    values = tuple(values)
+    for col in range(table.columnCount()):
+        text = values[col] if col < len(values) else ""
+        table.setItem(row, col, QTableWidgetItem("" if text is None else str(text)))
+    return row
 
 
 def create_ed_button(text: str, icon: str = "", parent=None) -> QPushButton:
@@ -366,19 +482,97 @@ def create_ed_progress_bar(min_val: int = 0, max_val: int = 100,
     return bar
 
 
+@functools.lru_cache(maxsize=32)
+def _ed_font(font_size: int, bold: bool) -> QFont:
+    """ED label font, built once per (size, bold); QFont is implicitly shared."""
+    font = QFont("Segoe UI", font_size)
+    font.setBold(bold)
+    return font
+
+
 def create_ed_label(text: str, font_size: int = 10, bold: bool = False,
                     color: Optional[str] = None, parent=None) -> QLabel:
     """Create a styled QLabel with ED theme."""
     label = QLabel(text, parent)
-    font = QFont("Segoe UI", font_size)
-    if bold:
-        font.setBold(True)
-    label.setFont(font)
+    label.setFont(_ed_font(font_size, bold))
     if color:
-        label.setStyleSheet(f"color: {color};")
+        set_label_color(label, color)
     return label
 
 
+def set_label_color(label: QLabel, color: str) -> None:
+    """
+    Set a label's text color.
+
+    Theme colors switch the edColor dynamic property (re-polished only when it
+    changes) so no per-label stylesheet is parsed; other colors fall back to
+    an inline stylesheet.
+    """
+    color_class = _ED_COLOR_CLASSES.get(color.upper())
+    if color_class is None:
+        label.setStyleSheet(f"color: {color};")
+        return
+    if label.property("edColor") != color_class:
+        label.setProperty("edColor", color_class)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+
+
+# ============================================================================
+# SHARED UPDATE TIMER
+# ============================================================================
+
+class _UpdateBus:
+    """One QTimer per interval, fanning out to every window registered on it."""
+
+    def __init__(self):
+        self._timers: Dict[int, QTimer] = {}
+        self._windows: Dict[int, "weakref.WeakSet"] = {}
+
+    def register(self, window: "EDBaseWindow", interval_ms: int) -> None:
+        """Start delivering _update_data calls to window every interval_ms."""
+        timer = self._timers.get(interval_ms)
+        if timer is None:
+            timer = QTimer()
+            timer.setInterval(interval_ms)
+            timer.timeout.connect(lambda: self._tick(interval_ms))
+            self._timers[interval_ms] = timer
+            self._windows[interval_ms] = weakref.WeakSet()
+        self._windows[interval_ms].add(window)
+        if not timer.isActive():
+            timer.start()
+
+    def unregister(self, window: "EDBaseWindow", interval_ms: int) -> None:
+        """Stop updates for window; the timer stops once nobody listens."""
+        windows = self._windows.get(interval_ms)
+        if windows is None:
+            return
+        windows.discard(window)
+        if not windows:
+            self._timers[interval_ms].stop()
+
+    def _tick(self, interval_ms: int) -> None:
+        for window in list(self._windows[interval_ms]):
+            # Nothing to repaint for a minimized window
+            if window.isMinimized():
+                continue
+            try:
+                window._update_data()
+            except Exception as e:
+                logger.error(f"{window.app_name}: update failed: {e}")
+
+
+_update_bus: Optional[_UpdateBus] = None
+
+
+def _get_update_bus() -> _UpdateBus:
+    global _update_bus
+    if _update_bus is None:
+        _update_bus = _UpdateBus()
+    return _update_bus
+
+
 # ============================================================================
 # BASE WINDOW CLASS
 # ============================================================================
@@ -388,9 +582,9 @@ class EDBaseWindow(QMainWindow):
     Base window class for all ED Mining Suite windows.
     
     Provides:
-    - Automatic ED theme application
+    - ED theme via the application-wide stylesheet
     - Config-driven settings
-    - Common update timer
+    - Common update timer (shared by all windows with the same interval)
     - Logging
     """
     
@@ -407,6 +601,10 @@ class EDBaseWindow(QMainWindow):
         """
         super().__init__()
         
+        # Deferred so importing the UI module does not pull in the database layer;
+        # load_config() itself reuses the parsed file until its mtime changes
+        from core.core_database import load_config
+
         self.app_name = app_name
         self.config = load_config()
         
@@ -423,12 +621,10 @@ class EDBaseWindow(QMainWindow):
         
         self.resize(width, height)
         
-        # Apply ED theme
-        self.setStyleSheet(get_base_stylesheet())
+        # ED theme is installed once on the QApplication (install_ed_theme)
         
-        # Setup update timer (subclasses override _update_data)
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self._update_data)
+        # Update ticks come from the shared _UpdateBus (subclasses override _update_data)
+        self._updates_active = False
         
         if update_interval_ms is None:
             update_interval_ms = self.config.get("ui_settings", {}).get("update_interval_ms", 1000)
@@ -439,22 +635,37 @@ class EDBaseWindow(QMainWindow):
     def _update_data(self):
         """
         Override this method in subclasses to update UI from database.
-        Called by update_timer on interval.
+        Called by the shared update timer on interval.
         """
         pass
     
     def start_updates(self):
-        """Start the update timer."""
-        if not self.update_timer.isActive():
-            self.update_timer.start(self.update_interval_ms)
+        """Start receiving update ticks."""
+        if not self._updates_active:
+            _get_update_bus().register(self, self.update_interval_ms)
+            self._updates_active = True
             logger.debug(f"{self.app_name}: Update timer started ({self.update_interval_ms}ms)")
     
     def stop_updates(self):
-        """Stop the update timer."""
-        if self.update_timer.isActive():
-            self.update_timer.stop()
+        """Stop receiving update ticks."""
+        if self._updates_active:
+            _get_update_bus().unregister(self, self.update_interval_ms)
+            self._updates_active = False
             logger.debug(f"{self.app_name}: Update timer stopped")
     
+    def hideEvent(self, event):
+        """Pause update ticks while hidden (start_updates state is kept)."""
+        if self._updates_active:
+            _get_update_bus().unregister(self, self.update_interval_ms)
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        """Resume update ticks and catch up immediately when shown again."""
+        super().showEvent(event)
+        if self._updates_active:
+            _get_update_bus().register(self, self.update_interval_ms)
+            self._update_data()
+    
     def get_color(self, color_name: str, default: str = "#FFFFFF") -> str:
         """Get color from config by name."""
         return self.config.get("colors", {}).get(color_name, default)
@@ -484,6 +695,10 @@ def format_percentage(value: float, decimals: int = 1) -> str:
     return f"{value:.{decimals}f}%"
 
 
+# Indexed by how many thresholds the percentage has reached
+_PROGRESS_COLORS = (ED_SUCCESS, ED_WARNING, ED_ERROR)
+
+
 def get_progress_bar_color(percentage: float,
                            warn_threshold: float = 75.0,
                            critical_threshold: float = 90.0) -> str:
@@ -498,20 +713,41 @@ def get_progress_bar_color(percentage: float,
     Returns:
         Color hex string
     """
-    if percentage >= critical_threshold:
-        return ED_ERROR
-    elif percentage >= warn_threshold:
-        return ED_WARNING
-    else:
-        return ED_SUCCESS
+    return _PROGRESS_COLORS[bisect.bisect_right((warn_threshold, critical_threshold), percentage)]
+
+
+def set_progress_bar_color(bar: QProgressBar, color: str) -> None:
+    """Set a progress bar's chunk color (re-polished only when it changes)."""
+    color_class = _ED_COLOR_CLASSES.get(color.upper())
+    if color_class is None:
+        bar.setStyleSheet(f"QProgressBar::chunk {{ background-color: {color}; }}")
+        return
+    if bar.property("edColor") != color_class:
+        bar.setProperty("edColor", color_class)
+        style = bar.style()
+        style.unpolish(bar)
+        style.polish(bar)
+
+
+@functools.lru_cache(maxsize=64)
+def _qcolor(color: str) -> QColor:
+    """Parse a color string once; QColor is a value type, so sharing it is safe."""
+    return QColor(color)
+
+
+@functools.lru_cache(maxsize=64)
+def _qbrush(color: str) -> QBrush:
+    """Solid brush for a color string, built once."""
+    return QBrush(_qcolor(color))
 
 
 def set_table_row_color(table: QTableWidget, row: int, color: str):
-    """Set background color for entire table row."""
+    """Set background color for entire table row (straight on the model)."""
+    model = table.model()
+    brush = _qbrush(color)
+    role = Qt.ItemDataRole.BackgroundRole
     for col in range(table.columnCount()):
-        item = table.item(row, col)
-        if item:
-            item.setBackground(QColor(color))
+        model.setData(model.index(row, col), brush, role)
 
 
 def set_table_cell_color(table: QTableWidget, row: int, col: int,
@@ -521,6 +757,6 @@ def set_table_cell_color(table: QTableWidget, row: int, col: int,
     item = table.item(row, col)
     if item:
         if fg_color:
-            item.setForeground(QColor(fg_color))
+            item.setForeground(_qcolor(fg_color))
         if bg_color:
-            item.setBackground(QColor(bg_color))
+            item.setBackground(_qcolor(bg_color))
@@ -13,7 +13,11 @@ Features:
 
 import os
 import sys
+import mmap
+import select
+import socket
 import time
+import re
 import json
 import logging
 from pathlib import Path
@@ -21,7 +25,28 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 import signal
 
-from core.core_database import get_db, init_db
+from core.core_database import get_db, init_db, LOG_READER_PID
+
+try:
+    import fcntl  # POSIX file locks
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows file locks
+
+try:
+    import simdjson  # Optional: SIMD JSON parsing with lazy field access
+except ImportError:
+    simdjson = None
+
+try:
+    import orjson  # Optional: fallback parser when simdjson is unavailable
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.observers import Observer  # Optional: inotify/ReadDirectoryChangesW/FSEvents
+except ImportError:
+    Observer = None
 
 
 # Configure logging
@@ -36,6 +61,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parser used when simdjson is not installed; both accept bytes
+_json_loads = orjson.loads if orjson else json.loads
+
+# Events replayed from the current journal on startup to restore the game state
+_STATE_EVENTS = ('LoadGame', 'Loadout', 'Cargo', 'Location', 'FSDJump')
+
+# Raw ProspectedAsteroid Content tokens -> content level
+_CONTENT_MAP = {
+    '$AsteroidMaterialContent_Low;': 'Low',
+    '$AsteroidMaterialContent_Medium;': 'Medium',
+    '$AsteroidMaterialContent_High;': 'High',
+}
+
+
+def _event_timestamp(data: Dict[str, Any]) -> str:
+    """Journal event timestamp; the current time is only formatted when it is missing."""
+    timestamp = data.get('timestamp')
+    return timestamp if timestamp is not None else datetime.utcnow().isoformat()
+
+
+# A busy lock is retried briefly: the UI's is_running() probe holds it for microseconds
+_LOCK_ATTEMPTS = 5
+_LOCK_RETRY_DELAY = 0.025
+
+
+def _acquire_instance_lock(path: Path) -> Optional[int]:
+    """
+    Lock the PID file and write our PID to it; None if another log reader holds the lock.
+
+    The lock is held as long as the returned fd stays open and the OS drops it
+    when the process dies, so a stale file never blocks the next start.
+    """
+    attempts = _LOCK_ATTEMPTS
+    while True:
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            attempts -= 1
+            if attempts == 0:
+                return None
+            time.sleep(_LOCK_RETRY_DELAY)
+            continue
+        # The previous owner may have unlinked the file between our open and lock
+        try:
+            if fcntl is None or os.stat(path).st_ino == os.fstat(fd).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    return fd
+
+
+def _release_instance_lock(fd: int, path: Path) -> None:
+    """Remove the PID file, then release its lock by closing the fd."""
+    try:
+        os.unlink(path)
+    except OSError as e:  # Windows refuses to unlink an open file
+        logger.debug("PID file not removed: %s", e)
+    os.close(fd)
+
+
 # ============================================================================
 # JOURNAL FILE MONITOR
 # ============================================================================
@@ -53,14 +146,22 @@ class JournalMonitor:
     def find_latest_journal(self) -> Optional[Path]:
         """Find the most recent journal file."""
         try:
-            journal_files = list(self.journal_dir.glob("Journal.*.log"))
-            if not journal_files:
+            # Journal names embed their start time, so the newest sorts last; current
+            # names (Journal.2023-01-01T...) contain '-' and rank above legacy
+            # Journal.YYMMDDhhmmss ones. Single pass, no stat() per file.
+            with os.scandir(self.journal_dir) as it:
+                latest = max(
+                    (e for e in it if e.name.startswith("Journal.") and e.name.endswith(".log")),
+                    key=lambda e: ('-' in e.name, e.name),
+                    default=None
+                )
+            if latest is None:
                 logger.warning("No journal files found")
                 return None
 
-            # Sort by modification time
-            latest = max(journal_files, key=lambda f: f.stat().st_mtime)
-            logger.info(f"Latest journal: {latest.name}")
+            latest = Path(latest.path)
+            if latest != self.current_file:
+                logger.info(f"Latest journal: {latest.name}")
             return latest
         except Exception as e:
             logger.error(f"Error finding journal: {e}")
@@ -73,7 +174,7 @@ class JournalMonitor:
                 self.file_handle.close()
 
             self.current_file = journal_file
-            self.file_handle = open(journal_file, 'r', encoding='utf-8')
+            self.file_handle = open(journal_file, 'rb')
 
             # Seek to end to only read new entries
             self.file_handle.seek(0, 2)
@@ -85,6 +186,33 @@ class JournalMonitor:
             logger.error(f"Error opening journal: {e}")
             return False
 
+    def read_last_events(self, events: List[str]) -> List[bytes]:
+        """
+        Return the last line of each given event already in the current journal, in file order.
+
+        The file is memory-mapped and searched backwards for each event, so only
+        those few lines are ever copied out of the (possibly large) journal.
+        """
+        if not self.current_file:
+            return []
+        try:
+            with open(self.current_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    found = []
+                    for event in events:
+                        pos = mm.rfind(b'"event":"' + event.encode() + b'"', 0, self.last_position)
+                        if pos < 0:
+                            continue
+                        start = mm.rfind(b'\n', 0, pos) + 1
+                        end = mm.find(b'\n', pos)
+                        found.append((start, mm[start:end if end >= 0 else len(mm)].strip()))
+            return [line for _, line in sorted(found)]
+        except Exception as e:
+            logger.error(f"Error reading journal state: {e}")
+            return []
+
     def check_for_new_file(self) -> bool:
         """Check if a newer journal file exists."""
         latest = self.find_latest_journal()
@@ -93,8 +221,8 @@ class JournalMonitor:
             return self.open_journal(latest)
         return False
 
-    def read_new_lines(self) -> List[str]:
-        """Read new lines from current journal file."""
+    def read_new_lines(self) -> List[bytes]:
+        """Read new lines (raw UTF-8 bytes) from current journal file."""
         if not self.file_handle:
             return []
 
@@ -102,11 +230,22 @@ class JournalMonitor:
             # Check for new file first
             self.check_for_new_file()
 
-            # Read new content
-            self.file_handle.seek(self.last_position)
-            lines = self.file_handle.readlines()
-            self.last_position = self.file_handle.tell()
+            # Nothing appended since last read: skip the seek/read entirely
+            size = os.fstat(self.file_handle.fileno()).st_size
+            if size <= self.last_position:
+                return []
 
+            # Read everything appended in one call; a trailing partial line is
+            # left for the next read (the game may be mid-write)
+            self.file_handle.seek(self.last_position)
+            chunk = self.file_handle.read(size - self.last_position)
+            end = chunk.rfind(b'\n') + 1
+            if not end:
+                return []
+            self.last_position += end
+
+            # Left as bytes: both parsers take UTF-8 input directly
+            lines = chunk[:end].splitlines()
             return [line.strip() for line in lines if line.strip()]
         except Exception as e:
             logger.error(f"Error reading journal: {e}")
@@ -120,6 +259,20 @@ class JournalMonitor:
             logger.info("Journal monitor closed")
 
 
+class _JournalWakeup:
+    """watchdog event handler that wakes the read loop when a journal file changes."""
+
+    def __init__(self, wake):
+        self.wake = wake
+
+    def dispatch(self, event) -> None:
+        # The game rewrites Status.json, Cargo.json etc. in the same directory
+        # several times a second; only Journal.*.log changes need a read
+        path = getattr(event, 'dest_path', None) or event.src_path
+        if os.path.basename(os.fsdecode(path)).startswith('Journal.'):
+            self.wake()
+
+
 # ============================================================================
 # JOURNAL EVENT PROCESSOR
 # ============================================================================
@@ -129,22 +282,40 @@ class JournalProcessor:
     def __init__(self):
         self.db = get_db()
         self.config = load_config()
+        # One reusable simdjson parser; its document is only valid until the next parse
+        self._parser = simdjson.Parser() if simdjson else None
+        # Event name -> bound _handle_<Event> method, resolved once
+        self._handlers = {
+            name[len('_handle_'):]: getattr(self, name)
+            for name in dir(self) if name.startswith('_handle_')
+        }
+        # Byte-level prefilter: lines whose event has no handler are never parsed
+        self._event_filter = re.compile(
+            rb'"event":\s*"(?:' + b'|'.join(re.escape(e.encode()) for e in self._handlers) + rb')"'
+        )
         logger.info("Journal processor initialized")
 
-    def process_line(self, line: str) -> None:
+    def process_line(self, line: bytes) -> None:
         """Process a single journal line."""
+        if not self._event_filter.search(line):
+            return
         try:
-            data = json.loads(line)
-            event = data.get('event', '')
+            if self._parser:
+                # Read 'event' off the lazy document; build a dict only for handled events
+                doc = self._parser.parse(line)
+                event = doc.get('event', '')
+            else:
+                doc = _json_loads(line)
+                event = doc.get('event', '')
 
             # Route to appropriate handler
-            handler = getattr(self, f'_handle_{event}', None)
+            handler = self._handlers.get(event)
             if handler:
-                handler(data)
+                handler(doc.as_dict() if self._parser else doc)
             else:
                 # Log unhandled events at debug level
-                logger.debug(f"Unhandled event: {event}")
-        except json.JSONDecodeError as e:
+                logger.debug("Unhandled event: %s", event)
+        except ValueError as e:  # json/orjson JSONDecodeError and simdjson errors
             logger.error(f"JSON decode error: {e} | Line: {line[:100]}")
         except Exception as e:
             logger.error(f"Error processing line: {e} | Line: {line[:100]}")
@@ -171,7 +342,7 @@ class JournalProcessor:
         try:
             system_name = data.get('StarSystem', 'Unknown')
             self.db.update_game_state(current_system=system_name)
-            logger.info(f"Location: {system_name}")
+            logger.info("Location: %s", system_name)
         except Exception as e:
             logger.error(f"Error handling Location: {e}")
 
@@ -180,7 +351,7 @@ class JournalProcessor:
         try:
             system_name = data.get('StarSystem', 'Unknown')
             self.db.update_game_state(current_system=system_name)
-            logger.info(f"FSDJump: {system_name}")
+            logger.info("FSDJump: %s", system_name)
         except Exception as e:
             logger.error(f"Error handling FSDJump: {e}")
 
@@ -189,7 +360,7 @@ class JournalProcessor:
         try:
             station = data.get('StationName', 'Unknown')
             system = data.get('StarSystem', 'Unknown')
-            logger.info(f"Docked: {station} in {system}")
+            logger.info("Docked: %s in %s", station, system)
         except Exception as e:
             logger.error(f"Error handling Docked: {e}")
 
@@ -231,7 +402,7 @@ class JournalProcessor:
                     cargo_count += count
 
             self.db.update_ship_status(cargo_count=cargo_count, limpet_count=limpet_count)
-            logger.info(f"Cargo: {cargo_count} items, {limpet_count} limpets")
+            logger.info("Cargo: %s items, %s limpets", cargo_count, limpet_count)
         except Exception as e:
             logger.error(f"Error handling Cargo: {e}")
 
@@ -242,7 +413,7 @@ class JournalProcessor:
             raw_count = len(data.get('Raw', []))
             encoded_count = len(data.get('Encoded', []))
             manufactured_count = len(data.get('Manufactured', []))
-            logger.debug(f"Materials: {raw_count} raw, {encoded_count} encoded, {manufactured_count} manufactured")
+            logger.debug("Materials: %s raw, %s encoded, %s manufactured", raw_count, encoded_count, manufactured_count)
         except Exception as e:
             logger.error(f"Error handling Materials: {e}")
 
@@ -252,60 +423,53 @@ class JournalProcessor:
     def _handle_ProspectedAsteroid(self, data: Dict[str, Any]) -> None:
         """Handle ProspectedAsteroid event (asteroid scan)."""
         try:
+            # Fields read in journal order: timestamp, Materials, MotherlodeMaterial, Content, Remaining
+            timestamp = _event_timestamp(data)
             materials = data.get('Materials', [])
-            content = data.get('Content', 'Unknown')
+            motherlode = data.get('MotherlodeMaterial')
+            content = _CONTENT_MAP.get(data.get('Content')) or data.get('Content_Localised', 'Unknown')
             remaining = data.get('Remaining', 100.0)
-            motherlode = data.get('MotherlodeAmount', 0)
-            timestamp = data.get('timestamp', datetime.utcnow().isoformat())
-
-            for material in materials:
-                material_name = material.get('Name', 'Unknown')
-                # Clean up material name (remove _Name suffix)
-                if '_Name' in material_name:
-                    material_name = material_name.replace('_Name', '')
-
-                percentage = material.get('Proportion', 0.0) * 100
-
-                # Determine if surface or deepcore
-                is_surface = 1 if motherlode == 0 else 0
-                is_deepcore = 1 if motherlode > 0 else 0
-                is_motherlode = 1 if motherlode > 0 else 0
-
-                # Insert into database
-                cursor = self.db.connection.cursor()
-                cursor.execute("""
-                    INSERT INTO prospected_asteroids 
-                    (timestamp, journal_timestamp, material_name, percentage, 
-                     is_motherlode, content_level, is_surface, is_deepcore, remaining, processed)
-                    VALUES (CURRENT_TIMESTAMP, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-                """, (timestamp, material_name, percentage, is_motherlode, 
-                      content, is_surface, is_deepcore, remaining))
-                self.db.connection.commit()
-
-                logger.info(f"Prospected: {material_name} {percentage:.1f}% ({'Deepcore' if is_deepcore else 'Surface'})")
+
+            # Determine if surface or deepcore (same for every material of the rock)
+            is_motherlode = is_deepcore = 1 if motherlode else 0
+            is_surface = 1 - is_deepcore
+
+            # Localised name when present (matches the material config), else the
+            # raw name with its _Name suffix stripped
+            rows = [
+                (timestamp,
+                 m.get('Name_Localised') or m.get('Name', 'Unknown').replace('_Name', ''),
+                 m.get('Proportion', 0.0) * 100,
+                 is_motherlode, content, is_surface, is_deepcore, remaining)
+                for m in materials
+            ]
+
+            kind = 'Deepcore' if is_deepcore else 'Surface'
+            for row in rows:
+                logger.info("Prospected: %s %.1f%% (%s)", row[1], row[2], kind)
+
+            # All materials of one asteroid in a single executemany/commit
+            self.db.add_prospected_asteroids_bulk(rows)
         except Exception as e:
             logger.error(f"Error handling ProspectedAsteroid: {e}")
 
     def _handle_MiningRefined(self, data: Dict[str, Any]) -> None:
         """Handle MiningRefined event (material collected)."""
-        try:
-            material_name = data.get('Type', 'Unknown')
-            if '_Name' in material_name:
-                material_name = material_name.replace('_Name', '')
+        material_type = data.get('Type')
+        if not material_type:
+            logger.warning("MiningRefined without Type: %s", data)
+            return
 
-            timestamp = data.get('timestamp', datetime.utcnow().isoformat())
+        # Localised name when present (matches the material config and the
+        # prospected rows), else the raw type with its _Name suffix stripped
+        material_name = data.get('Type_Localised') or material_type.replace('_Name', '')
 
-            cursor = self.db.connection.cursor()
-            cursor.execute("""
-                INSERT INTO refined_materials 
-                (timestamp, journal_timestamp, material_name, material_type)
-                VALUES (CURRENT_TIMESTAMP, ?, ?, 'mining')
-            """, (timestamp, material_name))
-            self.db.connection.commit()
+        # Queued; the writer thread commits a burst of refines in one transaction,
+        # retries while the database is busy, and counts rows it still loses
+        # (reported by the heartbeat and on stop)
+        self.db.add_refined_material(_event_timestamp(data), material_name)
 
-            logger.info(f"Refined: {material_name}")
-        except Exception as e:
-            logger.error(f"Error handling MiningRefined: {e}")
+        logger.info("Refined: %s", material_name)
 
     # ========================================================================
     # FSS / DISCOVERY EVENTS
@@ -317,7 +481,7 @@ class JournalProcessor:
             signal_type = data.get('SignalName_Localised', signal_name)
             is_station = data.get('IsStation', False)
             system_address = data.get('SystemAddress', 0)
-            timestamp = data.get('timestamp', datetime.utcnow().isoformat())
+            timestamp = _event_timestamp(data)
 
             # Get current system
             state = self.db.get_game_state()
@@ -326,11 +490,11 @@ class JournalProcessor:
             # Check if it's a fleet carrier
             if 'FleetCarrier' in signal_type or signal_name.endswith(')'):
                 self.db.add_fleet_carrier(signal_name, system_address, system_name, timestamp)
-                logger.info(f"Fleet Carrier discovered: {signal_name}")
+                logger.info("Fleet Carrier discovered: %s", signal_name)
             elif is_station:
                 self.db.add_fss_signal(signal_name, signal_type, is_station, 
                                       system_address, system_name, timestamp)
-                logger.info(f"Station discovered: {signal_name}")
+                logger.info("Station discovered: %s", signal_name)
         except Exception as e:
             logger.error(f"Error handling FSSSignalDiscovered: {e}")
 
@@ -346,7 +510,7 @@ class JournalProcessor:
             sender = data.get('From_Localised', 'Unknown')
             message = data.get('Message_Localised', '')[:50]
 
-            logger.info(f"Chat [{channel}] {sender}: {message}...")
+            logger.info("Chat [%s] %s: %s...", channel, sender, message)
         except Exception as e:
             logger.error(f"Error handling ReceiveText: {e}")
 
@@ -416,7 +580,15 @@ class LogReaderService:
         self.monitor = JournalMonitor(journal_dir)
         self.processor = JournalProcessor()
         self.running = False
-        self.scan_interval = 0.5  # seconds
+        self.scan_interval = 0.5  # seconds; only a fallback when file notifications are available
+        self.heartbeat_interval = 5.0  # seconds
+        # Self-pipe the loop blocks on; written by the file watcher and, via
+        # signal.set_wakeup_fd, by the interpreter when SIGINT/SIGTERM arrives
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._observer = None
+        self._pid_fd: Optional[int] = None
 
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -425,15 +597,28 @@ class LogReaderService:
         logger.info(f"Log reader service initialized: {journal_dir}")
 
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals."""
+        """Handle shutdown signals (the loop wakes via the wakeup fd and cleans up)."""
         logger.info(f"Received signal {signum}, shutting down...")
-        self.stop()
+        self.running = False
+
+    def _wake_up(self) -> None:
+        """Wake the main loop from another thread."""
+        try:
+            self._wake_w.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass  # Buffer full (a wakeup is already pending) or already closed
 
     def start(self) -> None:
         """Start the log reader service."""
         try:
             logger.info("Starting log reader service...")
 
+            # Singleton: refuse to start while another log reader holds the PID file lock
+            self._pid_fd = _acquire_instance_lock(LOG_READER_PID)
+            if self._pid_fd is None:
+                logger.error("Another log reader is already running, exiting")
+                return
+
             # Find and open latest journal
             latest_journal = self.monitor.find_latest_journal()
             if not latest_journal:
@@ -444,6 +629,10 @@ class LogReaderService:
                 logger.error("Failed to open journal, exiting")
                 return
 
+            # Restore commander, ship and location from the session so far
+            for line in self.monitor.read_last_events(_STATE_EVENTS):
+                self.processor.process_line(line)
+
             # Update service status in database
             self.processor.db.update_service_status(
                 is_running=1,
@@ -454,38 +643,66 @@ class LogReaderService:
             )
 
             self.running = True
+            signal.set_wakeup_fd(self._wake_w.fileno())
+            self._start_watcher()
             logger.info("Log reader service started successfully")
 
-            # Main loop
+            # Main loop; returns once a signal (or stop()) clears self.running
             self._run_loop()
+            self.stop()
         except Exception as e:
             logger.error(f"Error starting service: {e}")
             self.stop()
 
+    def _start_watcher(self) -> None:
+        """Watch the journal directory so the loop sleeps until the game writes."""
+        if Observer is None:
+            logger.info(f"watchdog not installed, polling every {self.scan_interval}s")
+            return
+        try:
+            observer = Observer()
+            observer.schedule(_JournalWakeup(self._wake_up), self.journal_dir, recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+            logger.info("Watching journal directory for changes")
+        except Exception as e:
+            logger.warning(f"File watcher unavailable ({e}), polling every {self.scan_interval}s")
+
     def _run_loop(self) -> None:
         """Main processing loop."""
-        heartbeat_counter = 0
-        heartbeat_interval = 10  # Update every 10 iterations
+        last_heartbeat = time.monotonic()
 
         while self.running:
             try:
                 # Read new lines from journal
                 lines = self.monitor.read_new_lines()
 
-                # Process each line
-                for line in lines:
-                    self.processor.process_line(line)
+                # Process each line; queued inserts go to the writer thread, and the
+                # batch only opens a transaction if a synchronous update happens
+                if lines:
+                    with self.processor.db.batch():
+                        for line in lines:
+                            self.processor.process_line(line)
 
                 # Update heartbeat periodically
-                heartbeat_counter += 1
-                if heartbeat_counter >= heartbeat_interval:
+                now = time.monotonic()
+                if now - last_heartbeat >= self.heartbeat_interval:
+                    lost = self.processor.db.pop_lost_writes()
+                    if lost:
+                        logger.error(f"{lost} journal rows could not be written to the database")
                     self.processor.db.update_service_status(
                         last_heartbeat=datetime.utcnow().isoformat()
                     )
-                    heartbeat_counter = 0
-
-                # Sleep between scans
-                time.sleep(self.scan_interval)
+                    last_heartbeat = now
+
+                # Sleep until the journal changes (or the poll/heartbeat timeout)
+                timeout = self.heartbeat_interval if self._observer else self.scan_interval
+                if select.select([self._wake_r], [], [], timeout)[0]:
+                    try:
+                        self._wake_r.recv(4096)  # Drain coalesced wakeups
+                    except BlockingIOError:
+                        pass
             except KeyboardInterrupt:
                 logger.info("Keyboard interrupt received")
                 break
@@ -497,9 +714,21 @@ class LogReaderService:
         """Stop the log reader service."""
         logger.info("Stopping log reader service...")
         self.running = False
+        self._wake_up()
+        try:
+            signal.set_wakeup_fd(-1)
+        except ValueError:
+            pass  # Not called from the main thread
+
+        if self._observer:
+            self._observer.stop()
+            self._observer = None
 
         # Update database
         try:
+            lost = self.processor.db.flush()
+            if lost:
+                logger.error(f"{lost} journal rows could not be written to the database")
             self.processor.db.update_service_status(
                 is_running=0,
                 last_heartbeat=datetime.utcnow().isoformat()
@@ -510,6 +739,11 @@ class LogReaderService:
         # Close monitor
         self.monitor.close()
 
+        # Release the singleton lock
+        if self._pid_fd is not None:
+            _release_instance_lock(self._pid_fd, LOG_READER_PID)
+            self._pid_fd = None
+
         logger.info("Log reader service stopped")
 
 
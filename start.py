@@ -11,7 +11,7 @@ import subprocess
 import traceback
 from pathlib import Path
 
-from core.core_ui import QApplication, QMainWindow, QMessageBox, QMdiArea, Qt
+from core.core_ui import QApplication, QMainWindow, QMessageBox, QMdiArea, Qt, install_ed_theme
 
 from core.core_database import (
     DATA_DIR, DB_PATH, CONFIG_PATH, init_db, load_config, get_db
@@ -357,6 +357,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("ED Mining Suite")
     app.setOrganizationName("ED Tools")
+    install_ed_theme(app)
     
     # Create and show main window
     manager = WindowManager()
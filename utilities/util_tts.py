@@ -1,7 +1,8 @@
 # tts_handler.py
+import queue
 import logging
-from threading import Thread
-from typing import List, Dict, Any
+from threading import Event, Lock, Thread
+from typing import Callable, List, Dict, Any
 from core.core_database import load_config
 
 
@@ -11,89 +12,173 @@ logger = logging.getLogger(__name__)
 class TTSHandler:
     """Handle text-to-speech functionality."""
 
-    def __init__(self):
-        """Initialize TTS engine."""
+    def __init__(self, enabled: bool = True):
+        """
+        Set up the speaker queue; pyttsx3 is imported and initialized by the speaker
+        thread on first use, and never when TTS is disabled in the config.
+        """
         self.engine = None
-        self.enabled = True
+        self.enabled = enabled
         self.current_voice_id = None
         self.available_voices = []
+        self._voice_list: List[Dict[str, str]] = []
+        self._rate = 150
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker = None
+        # Set once the speaker thread has enumerated the voices (or failed to start)
+        self._voices_ready = Event()
+        self._voice_callbacks: List[Callable[[List[Dict[str, str]]], None]] = []
+        self._callback_lock = Lock()
+
+    def _init_engine(self) -> bool:
+        """Create the engine on the speaker thread (slow on a cold SAPI/COM start); False if unavailable."""
         try:
             import pyttsx3
-            self.engine = pyttsx3.init()
-            self.engine.setProperty('rate', 150)
-            self.engine.setProperty('volume', 1.0)
-            self.available_voices = self.engine.getProperty('voices')
-            if self.available_voices:
+            engine = pyttsx3.init()
+            # Settings chosen before the thread started are applied here
+            engine.setProperty('rate', self._rate)
+            engine.setProperty('volume', 1.0)
+            self.available_voices = engine.getProperty('voices') or []
+            self._voice_list = self._build_voice_list(self.available_voices)
+            if self.current_voice_id is not None:
+                engine.setProperty('voice', self.current_voice_id)
+            elif self.available_voices:
                 self.current_voice_id = self.available_voices[0].id
+            if self.available_voices:
                 logger.info(f"TTS engine initialized with {len(self.available_voices)} voices")
             else:
                 logger.warning("TTS engine initialized but no voices found")
+            self.engine = engine
+            return True
         except Exception as e:
             logger.error(f"TTS initialization error: {e}")
             self.enabled = False
+            return False
+        finally:
+            self._publish_voices()
 
-    def get_available_voices(self) -> List[Dict[str, str]]:
+    def _publish_voices(self) -> None:
+        """Mark the voice list ready and hand it to everyone waiting for it."""
+        with self._callback_lock:
+            self._voices_ready.set()
+            callbacks, self._voice_callbacks = self._voice_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self.get_available_voices())
+            except Exception as e:
+                logger.error(f"TTS voice callback error: {e}")
+
+    def _start_worker(self) -> None:
+        """Start the speaker thread, which creates and owns the engine, on first use."""
+        if self._worker is None and self.enabled:
+            self._worker = Thread(target=self._run, name="tts", daemon=True)
+            self._worker.start()
+
+    def _put(self, item) -> None:
+        """Queue an item for the speaker thread, starting it on first use."""
+        if not self.enabled:
+            return
+        self._queue.put(item)
+        self._start_worker()
+
+    def _run(self) -> None:
+        """Speak queued text one utterance at a time; property changes arrive on the same queue."""
+        if not self._init_engine():
+            return
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                if isinstance(item, tuple):
+                    self.engine.setProperty(*item)
+                    continue
+                self.engine.say(item)
+                self.engine.runAndWait()
+                logger.debug(f"TTS spoke: {item}")
+            except Exception as e:
+                logger.error(f"TTS thread error: {e}")
+
+    @staticmethod
+    def _build_voice_list(available_voices) -> List[Dict[str, str]]:
+        """Build the voice dicts (with cleaned-up display names) once at init."""
         voices = []
-        if self.engine and self.available_voices:
-            for voice in self.available_voices:
-                name = voice.name
-                if "Microsoft" in name:
-                    name = name.replace("Microsoft ", "").split(" - ")[0]
-                voices.append({
-                    'id': voice.id,
-                    'name': name,
-                    'full_name': voice.name
-                })
+        for voice in available_voices or ():
+            name = voice.name
+            if "Microsoft" in name:
+                name = name.replace("Microsoft ", "").split(" - ")[0]
+            voices.append({
+                'id': voice.id,
+                'name': name,
+                'full_name': voice.name
+            })
         return voices
 
+    def get_available_voices(self) -> List[Dict[str, str]]:
+        """
+        Cached voice list (empty until the speaker thread has loaded it; see
+        on_voices_ready). The list is a copy, the dicts are shared (do not mutate).
+        """
+        return list(self._voice_list)
+
+    def on_voices_ready(self, callback: Callable[[List[Dict[str, str]]], None]) -> None:
+        """
+        Call callback(voices) once the voices are known, starting the speaker thread if needed.
+
+        The callback runs on the speaker thread unless the voices are already known,
+        so UI code should forward it to its own thread (e.g. via a queued Qt signal).
+        """
+        if not self.enabled:
+            callback([])
+            return
+        with self._callback_lock:
+            ready = self._voices_ready.is_set()
+            if not ready:
+                self._voice_callbacks.append(callback)
+        if ready:
+            callback(self.get_available_voices())
+        else:
+            self._start_worker()
+
     def set_voice(self, voice_id: str) -> None:
-        if self.engine and self.enabled:
+        if self.enabled:
             try:
-                self.engine.setProperty('voice', voice_id)
+                # Applied by _init_engine if the speaker thread has not started yet
                 self.current_voice_id = voice_id
+                if self._worker is not None:
+                    self._queue.put(('voice', voice_id))
                 logger.info(f"TTS voice changed to: {voice_id}")
             except Exception as e:
                 logger.error(f"Error setting TTS voice: {e}")
 
     def set_speed(self, speed: int) -> None:
-        if self.engine and self.enabled:
+        if self.enabled:
             try:
                 speed = max(50, min(300, speed))
-                self.engine.setProperty('rate', speed)
+                # Kept for _init_engine; only a running speaker thread gets the update queued
+                self._rate = speed
+                if self._worker is not None:
+                    self._queue.put(('rate', speed))
                 logger.debug(f"TTS speed set to: {speed}")
             except Exception as e:
                 logger.error(f"Error setting TTS speed: {e}")
 
     def speak(self, text: str) -> None:
-        """Speak text in a background thread."""
-        if not self.engine or not self.enabled:
+        """Queue text for the speaker thread (utterances play in order, never overlap)."""
+        if not self.enabled:
             logger.info(f"TTS (disabled): {text}")
             return
 
-        def speak_thread():
-            try:
-                import pyttsx3
-                engine = pyttsx3.init()
-                engine.setProperty('rate', self.engine.getProperty('rate'))
-                engine.setProperty('volume', self.engine.getProperty('volume'))
-                if self.current_voice_id:
-                    try:
-                        engine.setProperty('voice', self.current_voice_id)
-                    except Exception:
-                        pass
-                engine.say(text)
-                engine.runAndWait()
-                engine.stop()
-                logger.debug(f"TTS spoke: {text}")
-            except Exception as e:
-                logger.error(f"TTS thread error: {e}")
-
-        Thread(target=speak_thread, daemon=True).start()
+        self._put(text)
 
     def close(self):
-        """Cleanup TTS engine."""
+        """Stop the speaker thread once it finishes the current utterance."""
         try:
-            if hasattr(self, 'engine') and self.engine:
-                self.engine.stop()
+            # No engine.stop(): runAndWait has already drained the engine's queue,
+            # and stopping it from another thread can hang some SAPI builds
+            if self._worker:
+                self._queue.put(None)
+                self._worker.join(timeout=2.0)
+                self._worker = None
         except Exception as e:
             logger.error(f"TTS close error: {e}")
@@ -15,7 +15,9 @@ import sys
 import logging
 from typing import List, Dict, Any
 
-from core.core_ui import QApplication, QMainWindow, QMessageBox, QMdiArea, Qt
+from core.core_ui import (
+    QApplication, QMainWindow, QMessageBox, QMdiArea, Qt, install_ed_theme, set_label_color
+)
 
 from core.core_database import get_db
 from utilities.util_tts import TTSHandler
@@ -23,6 +25,9 @@ from utilities.util_tts import TTSHandler
 
 logger = logging.getLogger(__name__)
 
+# Oldest messages are dropped beyond this many table rows
+MAX_CHAT_ROWS = 1000
+
 # ============================================================================
 # CHAT TYPE CONFIGURATION - Icons and colors for different message types
 # ============================================================================
@@ -84,10 +89,10 @@ class ChatMonitor(EDBaseWindow):
 
         # Database and TTS
         self.db = get_db()
-        self.tts = TTSHandler()
+        self.tts = TTSHandler(enabled=config.get("tts_settings", {}).get("enabled", True))
 
-        # Track last seen timestamp
-        self.last_timestamp = "1970-01-01T00:00:00Z"
+        # Track last seen row as its (journal_ts_us, id) pagination key
+        self.last_chat_key = (0, 0)
 
         # Track last message type for separator insertion
         self.last_message_type = None
@@ -152,7 +157,7 @@ class ChatMonitor(EDBaseWindow):
 
         # Status label
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #00FF00;")
+        set_label_color(self.status_label, ED_SUCCESS)
         button_layout.addWidget(self.status_label)
 
         layout.addLayout(button_layout)
@@ -166,28 +171,31 @@ class ChatMonitor(EDBaseWindow):
         Overrides EDBaseWindow._update_data().
         """
         try:
-            # Get new messages since last timestamp
-            messages = self.db.get_new_chat_messages(self.last_timestamp)
+            # Stream new messages after the last row seen (newest at bottom)
+            new_count = 0
+            for msg in self.db.iter_new_chat_messages(self.last_chat_key):
+                self._add_message_to_table(msg)
+                self.last_chat_key = (msg["journal_ts_us"], msg["id"])
+                new_count += 1
 
-            if not messages:
+            if not new_count:
                 return
 
-            # Process messages (newest at bottom)
-            for msg in messages:
-                self._add_message_to_table(msg)
-                self.last_timestamp = msg["journal_timestamp"]
+            # Keep the table bounded (oldest rows drop off the top)
+            for _ in range(self.chat_table.rowCount() - MAX_CHAT_ROWS):
+                self.chat_table.removeRow(0)
 
             # Auto-scroll to bottom
             self.chat_table.scrollToBottom()
 
             # Update status
             total_rows = self.chat_table.rowCount()
-            self.status_label.setText(f"{len(messages)} new | {total_rows} total")
+            self.status_label.setText(f"{new_count} new | {total_rows} total")
 
         except Exception as e:
             logger.error(f"Error updating chat: {e}")
             self.status_label.setText(f"Error: {e}")
-            self.status_label.setStyleSheet("color: #FF0000;")
+            set_label_color(self.status_label, ED_ERROR)
 
     def _add_message_to_table(self, msg: Dict[str, Any]):
         """Add a single message to the table with formatting."""
@@ -271,14 +279,14 @@ class ChatMonitor(EDBaseWindow):
         try:
             self.db.clear_chat_messages()
             self.chat_table.setRowCount(0)
-            self.last_timestamp = "1970-01-01T00:00:00Z"
+            self.last_chat_key = (0, 0)
             self.last_message_type = None
             self.status_label.setText("Chat cleared")
             logger.info("Chat cleared")
         except Exception as e:
             logger.error(f"Error clearing chat: {e}")
             self.status_label.setText(f"Clear failed: {e}")
-            self.status_label.setStyleSheet("color: #FF0000;")
+            set_label_color(self.status_label, ED_ERROR)
 
     def closeEvent(self, event):
         """Handle window close - cleanup resources."""
@@ -297,6 +305,7 @@ if __name__ == "__main__":
 
     app = QApplication(sys.argv)
     app.setApplicationName("ED Chat Monitor")
+    install_ed_theme(app)
 
     window = ChatMonitor()
     window.show()
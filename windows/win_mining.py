@@ -16,17 +16,29 @@ Features:
 
 import sys
 import os
+import copy
+import signal
 import subprocess
 import time
 import logging
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
-from core.core_ui import QApplication, QMainWindow, QMessageBox, QMdiArea, Qt
+try:
+    import fcntl  # POSIX file locks
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows file locks
 
-from core.core_database import get_db
+from core.core_ui import (
+    QApplication, QMainWindow, QMessageBox, QMdiArea, Qt, install_ed_theme, set_label_color,
+    get_progress_bar_color, set_progress_bar_color, create_ed_table_row, QObject, QThread, Signal
+)
+
+from core.core_database import get_db, ProspectedAsteroid, LOG_READER_PID
 from utilities.util_tts import TTSHandler
 
 
@@ -37,12 +49,15 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 # CONSTANTS
 # ============================================================================
-MATERIALS = [
+MATERIALS = (
     "Platinum", "Painite", "Osmium", "Low Temperature Diamonds",
     "Rhodplumsite", "Serendibite", "Monazite", "Musgravite",
     "Grandidierite", "Benitoite", "Alexandrite", "Void Opals",
     "Bromellite", "Tritium"
-]
+)
+
+# Oldest detections are dropped beyond this many table rows
+MAX_DETECTION_ROWS = 200
 
 def get_default_log_path() -> str:
     """Get default Elite Dangerous log path."""
@@ -61,14 +76,46 @@ class LogReaderManager:
         self.script_path = "ed_log_reader.py"
 
     def is_running(self) -> bool:
-        """Check if log reader is running via database."""
+        """Check if log reader is running: our own child first, then the PID file lock it holds."""
+        if self.process is not None and self.process.poll() is None:
+            return True
+        return self._instance_lock_held()
+
+    @staticmethod
+    def _instance_lock_held() -> bool:
+        """Try the log reader's PID file lock without blocking; held means a reader is alive."""
         try:
-            db = get_db()
-            status = db.get_service_status()
-            return bool(status.get('is_running', 0))
-        except Exception as e:
-            logger.error(f"Error checking service status: {e}")
+            fd = os.open(LOG_READER_PID, os.O_RDWR)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.error(f"Error opening log reader PID file: {e}")
             return False
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        except OSError:
+            return True
+        finally:
+            # Closing the fd drops our probe lock straight away
+            os.close(fd)
+        return False
+
+    @staticmethod
+    def _reader_pid() -> Optional[int]:
+        """PID of the log reader holding the lock (from its PID file, else its status row)."""
+        try:
+            return int(LOG_READER_PID.read_text().strip())
+        except (OSError, ValueError):
+            pass  # Windows: the locked byte cannot be read by other processes
+        try:
+            return get_db().get_service_status().get('pid')
+        except Exception as e:
+            logger.error(f"Error reading log reader PID: {e}")
+            return None
 
     def start(self, log_path: str = None) -> bool:
         """Start the log reader service."""
@@ -97,15 +144,28 @@ class LogReaderManager:
             return False
 
     def stop(self) -> bool:
-        """Stop the log reader service."""
+        """Stop the log reader service (our own child, or one started elsewhere, e.g. by start.py)."""
         try:
-            db = get_db()
-            db.update_service_status(is_running=0)
-
             if self.process:
                 self.process.terminate()
                 self.process.wait(timeout=5)
                 self.process = None
+            elif self._instance_lock_held():
+                pid = self._reader_pid()
+                if not pid:
+                    logger.error("Log reader is running but its PID is unknown, cannot stop it")
+                    return False
+                os.kill(pid, signal.SIGTERM)
+                # The lock is released once the reader has finished shutting down
+                deadline = time.monotonic() + 5
+                while self._instance_lock_held():
+                    if time.monotonic() >= deadline:
+                        logger.error(f"Log reader (PID: {pid}) did not stop")
+                        return False
+                    time.sleep(0.1)
+
+            db = get_db()
+            db.update_service_status(is_running=0)
 
             logger.info("Log reader stopped")
             return True
@@ -115,11 +175,49 @@ class LogReaderManager:
 
     def restart(self, log_path: str = None) -> bool:
         """Restart the log reader service."""
-        self.stop()
+        if not self.stop():
+            return False
         time.sleep(1)
         return self.start(log_path)
 
 
+# ============================================================================
+# DATABASE POLLER
+# ============================================================================
+class ScanPoller(QObject):
+    """Runs the per-tick database reads on a worker thread and emits the results to the UI."""
+
+    dataReady = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self._last_data_version = None
+
+    @Slot()
+    def poll(self):
+        """Read everything the scan tab shows; emits nothing if the database is unchanged."""
+        try:
+            db = get_db()
+
+            # Nothing committed by the log reader since the last tick: skip the queries
+            version = db.data_version()
+            if version == self._last_data_version:
+                return
+
+            asteroids = db.get_unprocessed_asteroids()
+            snapshot = db.get_dashboard_snapshot()
+            snapshot['asteroids'] = asteroids
+            self.dataReady.emit(snapshot)
+
+            if asteroids:
+                # Only once handed to the UI (one UPDATE, one commit)
+                db.mark_asteroids_processed([asteroid.id for asteroid in asteroids])
+            # Remembered last, so a failed tick is retried on the next one
+            self._last_data_version = version
+        except Exception as e:
+            logger.error(f"Error polling database: {e}")
+
+
 # ============================================================================
 # MINING SCANNER UI
 # ============================================================================
@@ -128,6 +226,11 @@ class MiningScannerUI(EDBaseWindow):
     Main mining scanner window with tabs for scan, config, engine, stations, etc.
     """
 
+    # Timer tick -> ScanPoller.poll on the poller thread (queued connection)
+    _poll_requested = Signal()
+    # TTS voice list from the speaker thread -> voice combo (queued connection)
+    _voices_loaded = Signal(object)
+
     def __init__(self):
         # Load config for window settings
         config = load_config()
@@ -143,7 +246,7 @@ class MiningScannerUI(EDBaseWindow):
         # State
         self.db = get_db()
         self.config = config
-        self.tts = TTSHandler()
+        self.tts = TTSHandler(enabled=self.config.get("tts_settings", {}).get("enabled", True))
         self.log_reader_manager = LogReaderManager()
         self.log_path = get_default_log_path()
         self.last_asteroid_timestamp = None
@@ -152,6 +255,14 @@ class MiningScannerUI(EDBaseWindow):
         tts_speed = self.config.get("tts_settings", {}).get("speed", 150)
         self.tts.set_speed(tts_speed)
 
+        # Config save timer (coalesces bursts of setting changes into one write)
+        self.config_save_timer = QTimer(self)
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(500)
+        self.config_save_timer.timeout.connect(self._flush_config)
+        # Config files are written by a single background worker, never on the GUI thread
+        self._config_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-writer")
+
         # Create UI
         self._create_ui()
 
@@ -161,6 +272,14 @@ class MiningScannerUI(EDBaseWindow):
         # Check log reader
         self._check_log_reader_status()
 
+        # Database reads run on their own thread; results come back as a signal
+        self._poll_thread = QThread(self)
+        self._poller = ScanPoller()
+        self._poller.moveToThread(self._poll_thread)
+        self._poll_requested.connect(self._poller.poll)
+        self._poller.dataReady.connect(self._apply_snapshot)
+        self._poll_thread.start()
+
         # Start update timer
         self.start_updates()
 
@@ -197,6 +316,7 @@ class MiningScannerUI(EDBaseWindow):
         self._create_engine_tab()
         self._create_stations_tab()
         self._create_fc_tab()
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         self.setCentralWidget(central)
 
@@ -359,11 +479,11 @@ class MiningScannerUI(EDBaseWindow):
         stats_layout = QFormLayout()
 
         self.rocks_mined_label = QLabel("0")
-        self.rocks_mined_label.setStyleSheet(f"color: {ED_SUCCESS};")
+        set_label_color(self.rocks_mined_label, ED_SUCCESS)
         stats_layout.addRow("⛏️ Rocks Refined:", self.rocks_mined_label)
 
         self.hourly_profit_label = QLabel("0 Cr/hr")
-        self.hourly_profit_label.setStyleSheet(f"color: {ED_SUCCESS};")
+        set_label_color(self.hourly_profit_label, ED_SUCCESS)
         stats_layout.addRow("💰 Est. Hourly Profit:", self.hourly_profit_label)
 
         self.session_duration_label = QLabel("0m 0s")
@@ -384,8 +504,7 @@ class MiningScannerUI(EDBaseWindow):
         try:
             # Clear from database (mark all processed)
             asteroids = self.db.get_unprocessed_asteroids()
-            for asteroid in asteroids:
-                self.db.mark_asteroid_processed(asteroid['id'])
+            self.db.mark_asteroids_processed([asteroid.id for asteroid in asteroids])
 
             # Clear table
             self.detection_table.setRowCount(0)
@@ -430,10 +549,16 @@ class MiningScannerUI(EDBaseWindow):
         self.config_table.setColumnWidth(4, 100)
         layout.addWidget(self.config_table)
 
-        # Add material button
+        # Add material / save all buttons
+        config_btn_layout = QHBoxLayout()
         add_btn = create_ed_button("➕ Add Material", parent=self)
         add_btn.clicked.connect(self._add_material_config_row)
-        layout.addWidget(add_btn)
+        config_btn_layout.addWidget(add_btn)
+
+        save_all_btn = create_ed_button("💾 Save All", parent=self)
+        save_all_btn.clicked.connect(self._save_all_material_configs)
+        config_btn_layout.addWidget(save_all_btn)
+        layout.addLayout(config_btn_layout)
 
         # Fleet carrier group
         carrier_group = QGroupBox("🚢 Your Fleet Carrier")
@@ -461,14 +586,11 @@ class MiningScannerUI(EDBaseWindow):
         voice_layout = QHBoxLayout()
         voice_layout.addWidget(QLabel("Voice:"))
         self.voice_combo = QComboBox()
-        voices = self.tts.get_available_voices()
-        if voices:
-            for voice in voices:
-                self.voice_combo.addItem(voice['name'], voice['id'])
-            self.voice_combo.currentIndexChanged.connect(self._on_voice_changed)
-        else:
-            self.voice_combo.addItem("No voices available")
-            self.voice_combo.setEnabled(False)
+        # Filled the first time this tab is shown (which starts the TTS engine)
+        self.voice_combo.addItem("Loading voices...")
+        self.voice_combo.setEnabled(False)
+        self._voices_loaded.connect(self._populate_voice_combo)
+        self._voices_requested = False
         voice_layout.addWidget(self.voice_combo)
         voice_layout.addStretch()
         tts_layout.addLayout(voice_layout)
@@ -491,6 +613,7 @@ class MiningScannerUI(EDBaseWindow):
         tts_group.setLayout(tts_layout)
         layout.addWidget(tts_group)
 
+        self.config_tab = widget
         self.tabs.addTab(widget, "⚙️ Config")
 
     @Slot()
@@ -555,28 +678,49 @@ class MiningScannerUI(EDBaseWindow):
 
         self.config_table.setCellWidget(row, 5, btn_widget)
 
+    def _material_config_values(self, row: int) -> Tuple[str, float, int, bool, bool, bool]:
+        """Read (material, min %, price, surface, deepcore, enabled) from a config table row."""
+        material_combo = self.config_table.cellWidget(row, 0)
+        pct_spin = self.config_table.cellWidget(row, 1)
+        price_spin = self.config_table.cellWidget(row, 2)
+        surface_widget = self.config_table.cellWidget(row, 3)
+        deepcore_widget = self.config_table.cellWidget(row, 4)
+
+        return (
+            material_combo.currentText(),
+            pct_spin.value(),
+            price_spin.value(),
+            surface_widget.findChild(QCheckBox).isChecked(),
+            deepcore_widget.findChild(QCheckBox).isChecked(),
+            True
+        )
+
     def _save_material_config(self, row: int):
         """Save material configuration from table row."""
         try:
-            material_combo = self.config_table.cellWidget(row, 0)
-            pct_spin = self.config_table.cellWidget(row, 1)
-            price_spin = self.config_table.cellWidget(row, 2)
-            surface_widget = self.config_table.cellWidget(row, 3)
-            deepcore_widget = self.config_table.cellWidget(row, 4)
+            values = self._material_config_values(row)
+            material = values[0]
 
-            material = material_combo.currentText()
-            min_pct = pct_spin.value()
-            price = price_spin.value()
-            surface = surface_widget.findChild(QCheckBox).isChecked()
-            deepcore = deepcore_widget.findChild(QCheckBox).isChecked()
-
-            self.db.save_material_config(material, min_pct, price, surface, deepcore)
+            self.db.save_material_configs([values])
             QMessageBox.information(self, "Success", f"Configuration saved for {material}")
             logger.info(f"Material config saved: {material}")
         except Exception as e:
             logger.error(f"Error saving material config: {e}")
             QMessageBox.critical(self, "Error", f"Failed to save: {e}")
 
+    @Slot()
+    def _save_all_material_configs(self):
+        """Save every row of the config table in one transaction."""
+        try:
+            rows = [self._material_config_values(row) for row in range(self.config_table.rowCount())]
+
+            self.db.save_material_configs(rows)
+            QMessageBox.information(self, "Success", f"Saved {len(rows)} material configurations")
+            logger.info(f"Material configs saved: {len(rows)}")
+        except Exception as e:
+            logger.error(f"Error saving material configs: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to save: {e}")
+
     def _delete_material_config(self, row: int):
         """Delete material configuration."""
         try:
@@ -693,9 +837,27 @@ class MiningScannerUI(EDBaseWindow):
         if index >= 0:
             carrier_name = self.carrier_combo.itemData(index)
             self.config["fleet_carrier"] = carrier_name
-            save_config(self.config)
+            self._flush_config()
             logger.info(f"Fleet carrier set to: {carrier_name}")
 
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """Ask the TTS thread for its voices the first time the config tab is shown."""
+        if self.tabs.widget(index) is self.config_tab and not self._voices_requested:
+            self._voices_requested = True
+            self.tts.on_voices_ready(self._voices_loaded.emit)
+
+    def _populate_voice_combo(self, voices: List[Dict[str, str]]):
+        """Fill the voice combo with the voices the TTS engine reported."""
+        self.voice_combo.clear()
+        if voices:
+            for voice in voices:
+                self.voice_combo.addItem(voice['name'], voice['id'])
+            self.voice_combo.setEnabled(True)
+            self.voice_combo.currentIndexChanged.connect(self._on_voice_changed)
+        else:
+            self.voice_combo.addItem("No voices available")
+
     def _on_voice_changed(self, index: int):
         """Handle TTS voice change."""
         if index >= 0:
@@ -711,7 +873,12 @@ class MiningScannerUI(EDBaseWindow):
         if "tts_settings" not in self.config:
             self.config["tts_settings"] = {}
         self.config["tts_settings"]["speed"] = value
-        save_config(self.config)
+        self.config_save_timer.start()
+
+    def _flush_config(self):
+        """Queue a config write now (from a snapshot), cancelling any pending delayed save."""
+        self.config_save_timer.stop()
+        self._config_writer.submit(save_config, copy.deepcopy(self.config))
 
     @Slot()
     def _test_tts(self):
@@ -747,7 +914,7 @@ class MiningScannerUI(EDBaseWindow):
         service_layout = QVBoxLayout()
 
         self.service_status_label = QLabel("Status: Checking...")
-        self.service_status_label.setStyleSheet(f"color: {ED_WARNING};")
+        set_label_color(self.service_status_label, ED_WARNING)
         service_layout.addWidget(self.service_status_label)
 
         btn_layout = QHBoxLayout()
@@ -772,11 +939,11 @@ class MiningScannerUI(EDBaseWindow):
         state_layout = QFormLayout()
 
         self.cmdr_label = QLabel("Unknown")
-        self.cmdr_label.setStyleSheet(f"color: {ED_SUCCESS};")
+        set_label_color(self.cmdr_label, ED_SUCCESS)
         state_layout.addRow("Commander:", self.cmdr_label)
 
         self.system_label = QLabel("Unknown")
-        self.system_label.setStyleSheet(f"color: {ED_SUCCESS};")
+        set_label_color(self.system_label, ED_SUCCESS)
         state_layout.addRow("System:", self.system_label)
 
         state_group.setLayout(state_layout)
@@ -801,11 +968,11 @@ class MiningScannerUI(EDBaseWindow):
         log_path = self.log_path_input.text()
         if self.log_reader_manager.start(log_path):
             self.service_status_label.setText("Status: ✅ Running")
-            self.service_status_label.setStyleSheet(f"color: {ED_SUCCESS};")
+            set_label_color(self.service_status_label, ED_SUCCESS)
             self.tts.speak("Log reader started")
         else:
             self.service_status_label.setText("Status: ❌ Failed to start")
-            self.service_status_label.setStyleSheet(f"color: {ED_ERROR};")
+            set_label_color(self.service_status_label, ED_ERROR)
             QMessageBox.critical(self, "Error", "Failed to start log reader")
 
     @Slot()
@@ -813,7 +980,7 @@ class MiningScannerUI(EDBaseWindow):
         """Stop log reader service."""
         if self.log_reader_manager.stop():
             self.service_status_label.setText("Status: ⏹️ Stopped")
-            self.service_status_label.setStyleSheet(f"color: {ED_WARNING};")
+            set_label_color(self.service_status_label, ED_WARNING)
             self.tts.speak("Log reader stopped")
         else:
             QMessageBox.warning(self, "Warning", "Failed to stop log reader")
@@ -824,7 +991,7 @@ class MiningScannerUI(EDBaseWindow):
         log_path = self.log_path_input.text()
         if self.log_reader_manager.restart(log_path):
             self.service_status_label.setText("Status: ✅ Restarted")
-            self.service_status_label.setStyleSheet(f"color: {ED_SUCCESS};")
+            set_label_color(self.service_status_label, ED_SUCCESS)
             self.tts.speak("Log reader restarted")
         else:
             QMessageBox.critical(self, "Error", "Failed to restart log reader")
@@ -833,10 +1000,10 @@ class MiningScannerUI(EDBaseWindow):
         """Check log reader service status."""
         if self.log_reader_manager.is_running():
             self.service_status_label.setText("Status: ✅ Running")
-            self.service_status_label.setStyleSheet(f"color: {ED_SUCCESS};")
+            set_label_color(self.service_status_label, ED_SUCCESS)
         else:
             self.service_status_label.setText("Status: ⏹️ Not Running")
-            self.service_status_label.setStyleSheet(f"color: {ED_WARNING};")
+            set_label_color(self.service_status_label, ED_WARNING)
 
     # ========================================================================
     # STATIONS TAB
@@ -887,19 +1054,23 @@ class MiningScannerUI(EDBaseWindow):
             carriers = self.db.get_fleet_carriers()
             self.fc_table.setRowCount(len(carriers))
             for i, carrier in enumerate(carriers):
-                self.fc_table.setItem(i, 0, QTableWidgetItem(carrier.get('signal_name', '')))
-                self.fc_table.setItem(i, 1, QTableWidgetItem(str(carrier.get('system_address', ''))))
-                self.fc_table.setItem(i, 2, QTableWidgetItem(carrier.get('last_seen', '')))
-                self.fc_table.setItem(i, 3, QTableWidgetItem(carrier.get('discovered_timestamp', '')))
+                create_ed_table_row(self.fc_table, (
+                    carrier.get('signal_name', ''),
+                    carrier.get('system_address', ''),
+                    carrier.get('last_seen', ''),
+                    carrier.get('discovered_timestamp', ''),
+                ), i)
 
             # Stations
             stations = self.db.get_stations()
             self.stations_table.setRowCount(len(stations))
             for i, station in enumerate(stations):
-                self.stations_table.setItem(i, 0, QTableWidgetItem(station.get('signal_name', '')))
-                self.stations_table.setItem(i, 1, QTableWidgetItem(station.get('signal_type', '')))
-                self.stations_table.setItem(i, 2, QTableWidgetItem(str(station.get('system_address', ''))))
-                self.stations_table.setItem(i, 3, QTableWidgetItem(station.get('last_seen', '')))
+                create_ed_table_row(self.stations_table, (
+                    station.get('signal_name', ''),
+                    station.get('signal_type', ''),
+                    station.get('system_address', ''),
+                    station.get('last_seen', ''),
+                ), i)
 
             logger.info(f"Refreshed: {len(stations)} stations, {len(carriers)} fleet carriers")
         except Exception as e:
@@ -910,30 +1081,33 @@ class MiningScannerUI(EDBaseWindow):
     # ========================================================================
     @Slot()
     def _update_data(self):
-        """Update all data from database (called by timer)."""
+        """Ask the poller thread for fresh data (called by timer)."""
+        self._poll_requested.emit()
+
+    @Slot(object)
+    def _apply_snapshot(self, snapshot: Dict[str, Any]):
+        """Update all widgets from one poll result (runs on the GUI thread)."""
         try:
             # Update game state
-            state = self.db.get_game_state()
+            state = snapshot['state']
             self.cmdr_label.setText(state.get('commander_name', 'Unknown'))
             self.system_label.setText(state.get('current_system', 'Unknown'))
             self.system_sidebar_label.setText(state.get('current_system', 'Unknown'))
 
             # Update ship status
-            self._update_ship_status()
+            self._update_ship_status(snapshot['ship_status'])
 
             # Update asteroids
-            self._update_asteroids()
+            self._update_asteroids(snapshot['asteroids'])
 
             # Update statistics
-            self._update_statistics()
+            self._update_statistics(snapshot['refined_count'])
         except Exception as e:
             logger.error(f"Error updating data: {e}")
 
-    def _update_ship_status(self):
+    def _update_ship_status(self, status: Dict[str, Any]):
         """Update ship status (cargo, limpets, credits)."""
         try:
-            status = self.db.get_ship_status()
-
             # Credits
             credits = status.get('commander_credits', 0)
             self.credits_label.setText(format_credits(credits))
@@ -947,13 +1121,7 @@ class MiningScannerUI(EDBaseWindow):
             self.cargo_progress.setValue(int(cargo_pct))
 
             # Color code cargo bar
-            if cargo_pct >= 90:
-                color = ED_ERROR
-            elif cargo_pct >= 75:
-                color = ED_WARNING
-            else:
-                color = ED_SUCCESS
-            self.cargo_progress.setStyleSheet(f"QProgressBar::chunk {{ background-color: {color}; }}")
+            set_progress_bar_color(self.cargo_progress, get_progress_bar_color(cargo_pct))
 
             # Limpets
             limpets = status.get('limpet_count', 0)
@@ -970,40 +1138,36 @@ class MiningScannerUI(EDBaseWindow):
                 color = ED_WARNING
             else:
                 color = ED_SUCCESS
-            self.limpets_progress.setStyleSheet(f"QProgressBar::chunk {{ background-color: {color}; }}")
+            set_progress_bar_color(self.limpets_progress, color)
         except Exception as e:
             logger.error(f"Error updating ship status: {e}")
 
-    def _update_asteroids(self):
-        """Update asteroid detections."""
+    def _update_asteroids(self, asteroids: List[ProspectedAsteroid]):
+        """Update asteroid detections (already marked processed by the poller)."""
         try:
-            asteroids = self.db.get_unprocessed_asteroids()
+            if not asteroids:
+                return
 
-            # Get desired materials from config
-            desired_materials = self._get_desired_materials()
+            # Desired materials and their min % from config (one table walk per tick)
+            thresholds = self._get_material_thresholds()
 
+            # One repaint for the whole batch instead of one per inserted row
+            self.detection_table.setUpdatesEnabled(False)
             for asteroid in asteroids:
-                material = asteroid.get('material_name', '')
-                percentage = asteroid.get('percentage', 0.0)
+                material = asteroid.material_name or ''
+                percentage = asteroid.percentage or 0.0
 
                 # Check if material is in desired list and meets min %
-                should_display = False
-                for config_row in range(self.config_table.rowCount()):
-                    material_combo = self.config_table.cellWidget(config_row, 0)
-                    pct_spin = self.config_table.cellWidget(config_row, 1)
-
-                    if material_combo and material_combo.currentText() == material:
-                        if percentage >= pct_spin.value():
-                            should_display = True
-                            break
+                min_pct = thresholds.get(material)
+                should_display = min_pct is not None and percentage >= min_pct
 
-                if should_display or not desired_materials:
+                if should_display or not thresholds:
                     # Add to table
                     row = self.detection_table.rowCount()
                     self.detection_table.insertRow(row)
 
                     # Timestamp
-                    ts = asteroid.get('timestamp', '')
+                    ts = asteroid.timestamp or ''
                     self.detection_table.setItem(row, 0, QTableWidgetItem(str(ts)))
 
                     # Material
@@ -1017,50 +1181,51 @@ class MiningScannerUI(EDBaseWindow):
                         pct_item.setForeground(QColor(ED_SUCCESS))
                     self.detection_table.setItem(row, 2, pct_item)
 
-                    # Progress bar
-                    progress_widget = QWidget()
-                    progress_layout = QHBoxLayout(progress_widget)
-                    progress_layout.setContentsMargins(0, 0, 0, 0)
+                    # Progress bar (set directly; a wrapper widget + layout per row is pure overhead)
                     progress_bar = QProgressBar()
                     progress_bar.setRange(0, 100)
                     progress_bar.setValue(int(percentage))
-                    progress_layout.addWidget(progress_bar)
-                    self.detection_table.setCellWidget(row, 3, progress_widget)
+                    self.detection_table.setCellWidget(row, 3, progress_bar)
 
                     # Surface/Deepcore
-                    self.detection_table.setItem(row, 4, QTableWidgetItem("✓" if asteroid.get('is_surface') else ""))
-                    self.detection_table.setItem(row, 5, QTableWidgetItem("✓" if asteroid.get('is_deepcore') else ""))
+                    self.detection_table.setItem(row, 4, QTableWidgetItem("✓" if asteroid.is_surface else ""))
+                    self.detection_table.setItem(row, 5, QTableWidgetItem("✓" if asteroid.is_deepcore else ""))
 
                     # Content level
-                    content = asteroid.get('content_level', '')
+                    content = asteroid.content_level or ''
                     self.detection_table.setItem(row, 6, QTableWidgetItem(content))
 
                     # TTS announcement
                     if percentage >= 50:
                         self.tts.speak(f"{material} found at {int(percentage)} percent")
 
-                # Mark as processed
-                self.db.mark_asteroid_processed(asteroid['id'])
+            # Keep the table bounded (oldest rows drop off the top)
+            for _ in range(self.detection_table.rowCount() - MAX_DETECTION_ROWS):
+                self.detection_table.removeRow(0)
         except Exception as e:
             logger.error(f"Error updating asteroids: {e}")
+        finally:
+            self.detection_table.setUpdatesEnabled(True)
 
-    def _get_desired_materials(self) -> Set[str]:
-        """Get set of desired material names from config table."""
-        desired = set()
+    def _get_material_thresholds(self) -> Dict[str, float]:
+        """Map each desired material in the config table to its lowest configured min %."""
+        thresholds: Dict[str, float] = {}
         try:
             for row in range(self.config_table.rowCount()):
                 material_combo = self.config_table.cellWidget(row, 0)
-                if material_combo:
-                    desired.add(material_combo.currentText())
+                pct_spin = self.config_table.cellWidget(row, 1)
+                if material_combo and pct_spin:
+                    material = material_combo.currentText()
+                    min_pct = pct_spin.value()
+                    if min_pct < thresholds.get(material, float('inf')):
+                        thresholds[material] = min_pct
         except Exception as e:
             logger.error(f"Error getting desired materials: {e}")
-        return desired
+        return thresholds
 
-    def _update_statistics(self):
+    def _update_statistics(self, refined_count: int):
         """Update session statistics."""
         try:
-            # Get refined materials count
-            refined_count = self.db.get_refined_materials_count()
             self.rocks_mined_label.setText(str(refined_count))
 
             # TODO: Calculate hourly profit and session duration
@@ -1075,7 +1240,12 @@ class MiningScannerUI(EDBaseWindow):
         """Handle window close."""
         logger.info("Mining Scanner closing")
         self.stop_updates()
+        self._poll_thread.quit()
+        self._poll_thread.wait()
         self.stations_timer.stop()
+        if self.config_save_timer.isActive():
+            self._flush_config()
+        self._config_writer.shutdown(wait=True)
         self.tts.close()
         super().closeEvent(event)
 
@@ -1088,6 +1258,7 @@ if __name__ == "__main__":
 
     app = QApplication(sys.argv)
     app.setApplicationName("ED Mining Scanner")
+    install_ed_theme(app)
 
     window = MiningScannerUI()
     window.show()